@@ -0,0 +1,171 @@
+"""
+benchmark_matrix.py
+-------------------
+Timing and peak-memory sweeps for the Matrix routines, so we can see how
+each one scales as problem sizes grow and catch regressions.
+
+For every routine, size and dtype the best-of-`repeat` wall time and the
+peak memory traced by `tracemalloc` (NumPy reports its allocations to it)
+are recorded. Results can be saved as a JSON baseline and later runs
+compared against it.
+
+Usage:
+  python benchmark_matrix.py --output baseline.json
+  python benchmark_matrix.py --compare baseline.json --tolerance 0.25
+  python benchmark_matrix.py --routines predict rotate_point --sizes 1000 100000
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+import numpy as np
+
+from economic_input_output_model import leontief_total_output
+from linear_regression_matrix_mult import fit_linear_regression, predict
+from matrix_rotation_2d import rotate_point
+from recommender_matrix_factorization import recommend_for_user, svd_top_k
+from robotics_coordinate_transform import homogeneous_transform, transform_points
+
+# Each case maps a base size n and dtype to a zero-argument callable.
+# Routines with super-linear cost scale their own dimensions down from n.
+def _regression_data(n, dtype, rng):
+    hours = rng.uniform(0, 10, n).astype(dtype)
+    return hours, (40 + 5 * hours + rng.normal(0, 5, n)).astype(dtype)
+
+def _case_fit(n, dtype, rng):
+    hours, marks = _regression_data(n, dtype, rng)
+    return lambda: fit_linear_regression(hours, marks)
+
+def _case_predict(n, dtype, rng):
+    hours, marks = _regression_data(n, dtype, rng)
+    W = fit_linear_regression(hours, marks)
+    return lambda: predict(hours, W)
+
+def _case_leontief(n, dtype, rng):
+    sectors = max(2, int(n ** 0.5))  # n ~ number of matrix entries
+    A = (rng.uniform(0, 1, (sectors, sectors)) / (2 * sectors)).astype(dtype)
+    d = rng.uniform(10, 100, (sectors, 1)).astype(dtype)
+    return lambda: leontief_total_output(A, d)
+
+def _ratings(n, dtype, rng):
+    users, items = max(4, n // 100), max(4, n // 1000)  # n ~ 10x the number of ratings
+    R = rng.integers(0, 6, (users, items)).astype(dtype)
+    R[rng.uniform(size=R.shape) < 0.8] = 0
+    return R
+
+def _case_svd(n, dtype, rng):
+    R = _ratings(n, dtype, rng)
+    return lambda: svd_top_k(R, k=2)
+
+def _case_recommend(n, dtype, rng):
+    R = _ratings(n, dtype, rng)
+    return lambda: recommend_for_user(R, 0, top_n=3)
+
+def _case_transform(n, dtype, rng):
+    points = rng.normal(size=(n, 2)).astype(dtype)
+    T = homogeneous_transform(45, 2.0, 3.0)
+    return lambda: transform_points(points, T)
+
+def _case_rotate_point(n, dtype, rng):
+    points = rng.normal(size=(max(1, n // 1000), 2)).astype(dtype)  # Python-level loop
+    return lambda: [rotate_point(p, 30.0) for p in points]
+
+CASES = {
+    "fit_linear_regression": _case_fit,
+    "predict": _case_predict,
+    "leontief_total_output": _case_leontief,
+    "svd_top_k": _case_svd,
+    "recommend_for_user": _case_recommend,
+    "transform_points": _case_transform,
+    "rotate_point": _case_rotate_point,
+}
+
+def measure(fn, repeat: int = 5) -> dict:
+    """Best-of-`repeat` seconds and the peak traced bytes of one call."""
+    fn()  # warm-up
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"seconds": best, "peak_bytes": peak}
+
+def run(routines, sizes, dtypes, repeat: int = 5, seed: int = 0) -> list:
+    results = []
+    for name in routines:
+        for dtype in dtypes:
+            for n in sizes:
+                fn = CASES[name](n, np.dtype(dtype), np.random.default_rng(seed))
+                row = {"routine": name, "n": n, "dtype": dtype, **measure(fn, repeat)}
+                results.append(row)
+                print(f"{name:<24} {dtype:<8} n={n:<9} {row['seconds'] * 1e3:10.3f} ms "
+                      f"{row['peak_bytes'] / 2**20:9.2f} MiB", flush=True)
+    return results
+
+def scaling_exponents(results) -> dict:
+    """Log-log slope of time vs n per (routine, dtype): ~1 is linear, ~2 quadratic."""
+    exponents = {}
+    for key in sorted({(r["routine"], r["dtype"]) for r in results}):
+        rows = [r for r in results if (r["routine"], r["dtype"]) == key]
+        if len(rows) >= 2:
+            n = np.log([r["n"] for r in rows])
+            t = np.log([max(r["seconds"], 1e-9) for r in rows])
+            exponents[key] = float(np.polyfit(n, t, 1)[0])
+    return exponents
+
+def compare(results, baseline, tolerance: float = 0.25) -> list:
+    """Rows whose time or peak memory grew by more than `tolerance` vs the baseline."""
+    base = {(r["routine"], r["n"], r["dtype"]): r for r in baseline["results"]}
+    regressions = []
+    for r in results:
+        old = base.get((r["routine"], r["n"], r["dtype"]))
+        if old is None:
+            continue
+        for metric in ("seconds", "peak_bytes"):
+            if old[metric] > 0 and r[metric] > old[metric] * (1 + tolerance):
+                regressions.append({**r, "metric": metric, "baseline": old[metric],
+                                    "ratio": r[metric] / old[metric]})
+    return regressions
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--routines", nargs="+", default=list(CASES), choices=list(CASES))
+    parser.add_argument("--sizes", nargs="+", type=int, default=[1_000, 10_000, 100_000, 1_000_000])
+    parser.add_argument("--dtypes", nargs="+", default=["float64", "float32"])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument("--compare", help="baseline JSON file to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed relative slowdown/growth")
+    args = parser.parse_args(argv)
+
+    results = run(args.routines, args.sizes, args.dtypes, repeat=args.repeat)
+
+    print("\nScaling exponents (time ~ n^k):")
+    for (name, dtype), k in scaling_exponents(results).items():
+        print(f"  {name:<24} {dtype:<8} k={k:.2f}")
+
+    if args.output:
+        meta = {"python": platform.python_version(), "numpy": np.__version__, "machine": platform.machine()}
+        with open(args.output, "w") as f:
+            json.dump({"meta": meta, "results": results}, f, indent=2)
+        print(f"\nWrote {len(results)} results to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        print(f"\n{len(regressions)} regression(s) vs {args.compare} (tolerance {args.tolerance:.0%}):")
+        for r in regressions:
+            print(f"  {r['routine']:<24} {r['dtype']:<8} n={r['n']:<9} {r['metric']}: "
+                  f"{r['baseline']:.4g} -> {r[r['metric']]:.4g} ({r['ratio']:.2f}x)")
+        return 1 if regressions else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,13 +9,82 @@ where
   d is final demand,
   x is total output required to satisfy d.
 
+`LeontiefModel` factors I - A once (dense LU, or sparse LU when A is a
+scipy.sparse matrix) and solves whole batches of demand vectors against
+it. For economies too large to factor, method="neumann" sums the series
+x = d + A d + A^2 d + ... until it converges, using only products with A.
+
 Real-world use: estimate ripple effects across industries when demand changes.
 """
 import numpy as np
 
 def leontief_total_output(A: np.ndarray, d: np.ndarray) -> np.ndarray:
     I = np.eye(A.shape[0])
-    return np.linalg.inv(I - A) @ d
+    return np.linalg.solve(I - A, d)
+
+class LeontiefModel:
+    """Reusable solver for x = (I - A)^(-1) d over many demand vectors.
+
+    Args:
+        A: (n, n) technical coefficients, a NumPy array or scipy.sparse matrix
+        method: "lu" to factor I - A once, or "neumann" for the iterative
+            series (needs a productive economy, i.e. spectral radius of A < 1)
+        tol: relative change at which the Neumann series is considered converged
+        max_iter: maximum number of Neumann terms
+    """
+
+    def __init__(self, A, method: str = "lu", tol: float = 1e-10, max_iter: int = 1000):
+        if isinstance(A, np.ndarray):
+            self.sparse = False
+        else:
+            from scipy.sparse import issparse
+
+            self.sparse = issparse(A)
+        self.A = A if self.sparse else np.asarray(A, dtype=float)
+        self.n = self.A.shape[0]
+        self.method = method
+        self.tol = tol
+        self.max_iter = max_iter
+        self.iterations = None  # Neumann terms used by the last solve
+        if method == "lu":
+            self._solve = self._factor()
+        elif method != "neumann":
+            raise ValueError(f"unknown method {method!r}; use 'lu' or 'neumann'")
+
+    def _factor(self):
+        if self.sparse:
+            from scipy.sparse import identity
+            from scipy.sparse.linalg import splu
+
+            lu = splu((identity(self.n, format="csc") - self.A).tocsc())
+            return lu.solve
+        from scipy.linalg import lu_factor, lu_solve
+
+        lu_piv = lu_factor(np.eye(self.n) - self.A)
+        return lambda d: lu_solve(lu_piv, d)
+
+    def _neumann(self, d):
+        x = d.copy()
+        term = d
+        for k in range(1, self.max_iter + 1):
+            term = self.A @ term
+            x += term
+            if np.linalg.norm(term) <= self.tol * np.linalg.norm(x):
+                self.iterations = k
+                return x
+        raise RuntimeError(
+            f"Neumann series did not converge in {self.max_iter} terms; "
+            "check that A is productive or use method='lu'"
+        )
+
+    def total_output(self, d) -> np.ndarray:
+        """Total output for demand d of shape (n,) or a batch of columns (n, k)."""
+        d = np.asarray(d, dtype=float)
+        if d.shape[0] != self.n:
+            raise ValueError(f"demand has {d.shape[0]} rows, expected {self.n}")
+        if self.method == "neumann":
+            return self._neumann(d)
+        return self._solve(d)
 
 if __name__ == "__main__":
     # Example with 3 industries: Agriculture, Manufacturing, Services
@@ -32,3 +101,12 @@ if __name__ == "__main__":
     x = leontief_total_output(A, d)
     print("Total output required (billions):")
     print(x.ravel())
+
+    # Demand scenarios as columns: baseline, +10% services, -20% agriculture
+    scenarios = np.hstack([d, d * [[1.0], [1.0], [1.1]], d * [[0.8], [1.0], [1.0]]])
+    model = LeontiefModel(A)
+    print("Total output per scenario (columns):")
+    print(model.total_output(scenarios))
+    neumann = LeontiefModel(A, method="neumann", tol=1e-12)
+    agrees = np.allclose(neumann.total_output(scenarios), model.total_output(scenarios))
+    print(f"Neumann series agrees after {neumann.iterations} terms: {agrees}")
@@ -8,34 +8,210 @@ A minimal linear regression example that uses matrix multiplication
   2) Solves for weights W using the Normal Equation
   3) Uses matrix multiplication (X @ W) to make predictions
 
+The Normal Equation is solved through a factorization of X (Cholesky of
+X^T X, or QR of X) instead of an explicit inverse. `LeastSquaresFactor`
+keeps that factorization so many target columns, or a whole stack of
+design matrices of shape (..., n, p), are solved with one factorization
+per X.
+
+`StreamingLinearRegression` accumulates the sufficient statistics X^T X
+and X^T y chunk by chunk (from arrays, np.memmap or CSV files), so data
+larger than memory can be fitted, and partial fits from worker processes
+can be merged before finalizing the weights.
+
 Real-world tie-in: this is essentially what happens inside one layer
 of a neural network or a regression model when transforming inputs.
 """
+import itertools
 import numpy as np
 
+def add_bias_column(x, out=None):
+    """Return the design matrix [1 | x] for features x of shape (n,) or (n, p).
+
+    If `out` (shape (n, p + 1)) is given the design matrix is written into
+    it, so repeated fits over same-sized batches reuse one buffer.
+    """
+    x = np.asarray(x, dtype=float)
+    if x.ndim == 1:
+        x = x.reshape(-1, 1)
+    if out is None:
+        out = np.empty((x.shape[0], x.shape[1] + 1), dtype=float)
+    out[:, 0] = 1.0
+    out[:, 1:] = x
+    return out
+
+def _fold_columns(solve_2d, B):
+    """Apply solve_2d, which maps an (m, k) matrix to a (p, k) one, to B of shape (..., m, k).
+
+    A stack of right-hand sides is folded into the columns of a single
+    (m, stack * k) matrix, so it costs one call instead of one per matrix.
+    """
+    if B.ndim == 2:
+        return solve_2d(B)
+    m, k = B.shape[-2:]
+    W = solve_2d(np.moveaxis(B, -2, 0).reshape(m, -1))
+    return np.moveaxis(W.reshape((-1,) + B.shape[:-2] + (k,)), 0, -2)
+
+def _cholesky_solve(L, B):
+    """Solve (L L^T) W = B given the Cholesky factor L (two O(p^2) triangular solves)."""
+    from scipy.linalg import cho_solve
+
+    return _fold_columns(lambda B2: cho_solve((L, True), B2, check_finite=False), B)
+
+def _upper_triangular_solve(R, B):
+    """Solve R W = B for upper-triangular R by back substitution."""
+    from scipy.linalg import solve_triangular
+
+    return _fold_columns(lambda B2: solve_triangular(R, B2, lower=False, check_finite=False), B)
+
+class LeastSquaresFactor:
+    """Factorization of a design matrix X, reusable across targets.
+
+    X may be a single (n, p) matrix or a stack (..., n, p). With
+    method="cholesky" the Gram matrix X^T X = L L^T is factored (fastest,
+    fine for well-conditioned X); method="qr" factors X = QR, which is
+    slower but stays accurate when X^T X is close to singular. Each
+    solve() is then only triangular substitutions (SciPy, loaded on first
+    solve), O(p^2) per target instead of a fresh O(p^3) factorization.
+    For a stack of X the triangular factors are inverted once, in one
+    batched call, and every solve is a pair of batched matmuls.
+    """
+
+    def __init__(self, X, method: str = "cholesky"):
+        X = np.asarray(X, dtype=float)
+        if X.ndim < 2:
+            raise ValueError("X must have shape (..., n, p)")
+        self.X = X
+        self.method = method
+        if method == "cholesky":
+            self._L = np.linalg.cholesky(np.swapaxes(X, -1, -2) @ X)
+        elif method == "qr":
+            self._Q, self._R = np.linalg.qr(X)
+        else:
+            raise ValueError(f"unknown method {method!r}; use 'cholesky' or 'qr'")
+        self._inverse = None
+
+    def _stack_inverse(self) -> np.ndarray:
+        """Inverses of the stacked triangular factors (L or R), computed on the first stacked solve."""
+        if self._inverse is None:
+            self._inverse = np.linalg.inv(self._L if self.method == "cholesky" else self._R)
+        return self._inverse
+
+    def solve(self, Y):
+        """Solve for weights of shape (..., p, k) given targets Y of shape (..., n, k).
+
+        A target of shape (..., n) returns weights of shape (..., p).
+        """
+        Y = np.asarray(Y, dtype=float)
+        vector = Y.ndim == self.X.ndim - 1
+        if vector:
+            Y = Y[..., None]
+        if self.X.ndim == 2:
+            # One X: a stack of targets is folded into columns and solved in one call
+            if self.method == "cholesky":
+                W = _fold_columns(lambda Y2: _cholesky_solve(self._L, self.X.T @ Y2), Y)
+            else:
+                W = _fold_columns(lambda Y2: _upper_triangular_solve(self._R, self._Q.T @ Y2), Y)
+        elif self.method == "cholesky":
+            L_inv = self._stack_inverse()
+            W = np.swapaxes(L_inv, -1, -2) @ (L_inv @ (np.swapaxes(self.X, -1, -2) @ Y))
+        else:
+            W = self._stack_inverse() @ (np.swapaxes(self._Q, -1, -2) @ Y)
+        return W[..., 0] if vector else W
+
+def fit_least_squares(X, Y, method: str = "cholesky"):
+    """Solve min ||X W - Y|| for every target column (and every X in a stack)."""
+    return LeastSquaresFactor(X, method=method).solve(Y)
+
 def fit_linear_regression(hours, marks):
     """Fit y = W0 + W1 * x via Normal Equation.
 
     Args:
         hours (array-like): input feature (hours studied)
-        marks (array-like): target values (marks)
+        marks (array-like): target values (marks); pass a 2-D array to
+            fit one model per column against the same factorization
     Returns:
-        W (2x1 ndarray): [[intercept], [slope]]
+        W (2xk ndarray): [[intercept], [slope]]
+    """
+    X = add_bias_column(hours)
+    y = np.asarray(marks, dtype=float).reshape(X.shape[0], -1)
+    return fit_least_squares(X, y)  # shape (2,k)
+
+class StreamingLinearRegression:
+    """Linear regression fitted from running sums of X^T X and X^T y.
+
+    Memory use depends only on the number of features and targets, not on
+    the number of rows seen. The bias column is folded into the sums
+    directly instead of being appended to every chunk.
     """
-    x = np.asarray(hours).reshape(-1, 1)
-    y = np.asarray(marks).reshape(-1, 1)
 
-    # Design matrix with bias column
-    X = np.hstack([np.ones((x.shape[0], 1)), x])
-    # Normal Equation: W = (X^T X)^(-1) X^T y
-    W = np.linalg.inv(X.T @ X) @ X.T @ y
-    return W  # shape (2,1)
+    def __init__(self, n_features: int = 1, n_targets: int = 1):
+        p = n_features + 1
+        self.n_samples = 0
+        self.xtx = np.zeros((p, p))
+        self.xty = np.zeros((p, n_targets))
+
+    def partial_fit(self, x, y):
+        """Add one chunk of rows: x of shape (m,) or (m, n_features), y of shape (m,) or (m, n_targets)."""
+        x = np.asarray(x, dtype=float).reshape(-1, self.xtx.shape[0] - 1)
+        y = np.asarray(y, dtype=float).reshape(x.shape[0], -1)
+        self.n_samples += x.shape[0]
+        self.xtx[0, 0] += x.shape[0]
+        col_sums = x.sum(axis=0)
+        self.xtx[0, 1:] += col_sums
+        self.xtx[1:, 0] += col_sums
+        self.xtx[1:, 1:] += x.T @ x
+        self.xty[0] += y.sum(axis=0)
+        self.xty[1:] += x.T @ y
+        return self
+
+    def fit_chunks(self, chunks):
+        """Consume an iterable of (x, y) chunks, e.g. from `iter_array_chunks` or `iter_csv_chunks`."""
+        for x, y in chunks:
+            self.partial_fit(x, y)
+        return self
+
+    def merge(self, other: "StreamingLinearRegression"):
+        """Add the statistics of another estimator (e.g. one returned by a worker process)."""
+        if other.xty.shape != self.xty.shape:
+            raise ValueError("cannot merge estimators with different shapes")
+        self.n_samples += other.n_samples
+        self.xtx += other.xtx
+        self.xty += other.xty
+        return self
+
+    def weights(self):
+        """Solve the Normal Equation for the rows seen so far: W of shape (n_features + 1, n_targets)."""
+        if self.n_samples <= self.xtx.shape[0] - 1:
+            raise ValueError("need more samples than features to solve for the weights")
+        return _cholesky_solve(np.linalg.cholesky(self.xtx), self.xty)
+
+def iter_array_chunks(x, y, chunk_size: int = 100_000):
+    """Yield (x, y) slices of arrays or np.memmap files without copying the whole array."""
+    for start in range(0, len(x), chunk_size):
+        yield x[start:start + chunk_size], y[start:start + chunk_size]
+
+def iter_csv_chunks(path, x_cols, y_cols, chunk_size: int = 100_000, delimiter=",", skip_header: int = 1):
+    """Yield (x, y) chunks read from a numeric CSV file, `chunk_size` lines at a time."""
+    x_cols, y_cols = list(np.atleast_1d(x_cols)), list(np.atleast_1d(y_cols))
+    with open(path) as f:
+        for _ in range(skip_header):
+            next(f, None)
+        while True:
+            lines = list(itertools.islice(f, chunk_size))
+            if not lines:
+                break
+            block = np.loadtxt(lines, delimiter=delimiter, ndmin=2)
+            yield block[:, x_cols], block[:, y_cols]
 
 def predict(hours, W):
-    """Make predictions using matrix multiplication: y_pred = X @ W."""
-    x = np.asarray(hours).reshape(-1, 1)
-    X = np.hstack([np.ones((x.shape[0], 1)), x])
-    return X @ W
+    """Make predictions using matrix multiplication: y_pred = X @ W.
+
+    Computed as x @ W[1:] + W[0], so the bias column is never materialized.
+    """
+    x = np.asarray(hours, dtype=float).reshape(-1, 1)
+    W = np.asarray(W)
+    return x @ W[1:] + W[0]
 
 if __name__ == "__main__":
     # Example dataset (Hours vs Marks)
@@ -51,3 +227,14 @@ if __name__ == "__main__":
     preds = predict(new_hours, W)
     for h, p in zip(new_hours, preds.ravel()):
         print(f"Hours={h:>2} -> predicted marks = {p:.2f}")
+
+    # Many targets against one factorization: marks, plus two rescaled exams
+    factor = LeastSquaresFactor(add_bias_column(hours), method="qr")
+    targets = np.column_stack([marks, 0.5 * marks + 10, marks - hours])
+    print("Weights for 3 targets (columns):")
+    print(factor.solve(targets))
+
+    # Streaming fit: two "workers" each see half of the rows, then merge
+    left = StreamingLinearRegression().fit_chunks(iter_array_chunks(hours[:6], marks[:6], chunk_size=4))
+    right = StreamingLinearRegression().fit_chunks(iter_array_chunks(hours[6:], marks[6:], chunk_size=4))
+    print("Streaming weights:", left.merge(right).weights().ravel())
@@ -0,0 +1,195 @@
+"""
+dataset_cache.py
+----------------
+Columnar binary cache for the CSV datasets used by these scripts.
+
+On first use a CSV is parsed once and every column is written to its own
+`.npy` file, downcast where that is safe (float64 -> float32 while values
+fit, integers -> the smallest integer type holding their range, so a 0/1
+label becomes int8). Later runs open the columns with `np.load(mmap_mode="r")`
+in milliseconds: nothing is read until a column is touched, and only the
+columns used are paged in.
+
+The cache lives next to the CSV in `.dataset_cache/<name>/` and records the
+SHA-256 of the source file. When the file's size or mtime changes the hash is
+recomputed, and a different hash rebuilds the cache.
+"""
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+import numpy as np
+
+CACHE_VERSION = 1
+
+def file_digest(path, block_size: int = 1 << 20) -> str:
+    """SHA-256 hex digest of a file, read in blocks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def downcast(values: np.ndarray, float_dtype=np.float32) -> np.ndarray:
+    """Smallest dtype that holds the column: float_dtype for finite floats in range, the smallest signed int for ints.
+
+    Integers stay signed, so label arithmetic such as `y - 1` cannot wrap.
+    """
+    if values.dtype.kind in "iu":
+        if values.size == 0:
+            return values
+        lo, hi = values.min(), values.max()
+        for dtype in (np.int8, np.int16, np.int32, np.int64):
+            info = np.iinfo(dtype)
+            if info.min <= lo and hi <= info.max:
+                return values.astype(dtype)
+        return values
+    if values.dtype.kind == "f" and float_dtype is not None:
+        finite = values[np.isfinite(values)]
+        if finite.size == 0 or np.abs(finite).max() <= np.finfo(float_dtype).max:
+            return values.astype(float_dtype)
+    return values
+
+class ColumnarDataset:
+    """Read-only, memory-mapped columns of a cached CSV."""
+
+    def __init__(self, cache_dir: Path, manifest: dict):
+        self.cache_dir = Path(cache_dir)
+        self.manifest = manifest
+        self.columns = [c["name"] for c in manifest["columns"]]
+        self.n_rows = manifest["n_rows"]
+        self._files = {c["name"]: c["file"] for c in manifest["columns"]}
+        self._arrays = {}
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        """One column as a read-only memmap (no copy)."""
+        if name not in self._arrays:
+            if name not in self._files:
+                raise KeyError(name)
+            self._arrays[name] = np.load(self.cache_dir / self._files[name], mmap_mode="r")
+        return self._arrays[name]
+
+    def __len__(self) -> int:
+        return self.n_rows
+
+    def dtypes(self) -> dict:
+        return {c["name"]: c["dtype"] for c in self.manifest["columns"]}
+
+    def matrix(self, columns=None, exclude=(), dtype=None) -> np.ndarray:
+        """Stack columns into an (n_rows x n_columns) array; this one copies."""
+        columns = [c for c in (columns or self.columns) if c not in exclude]
+        dtype = dtype or np.result_type(*(self[c].dtype for c in columns))
+        out = np.empty((self.n_rows, len(columns)), dtype=dtype)
+        for j, name in enumerate(columns):
+            out[:, j] = self[name]
+        return out
+
+    def iter_chunks(self, chunk_size: int = 100_000, columns=None, exclude=(), dtype=None):
+        """Yield (rows x columns) blocks of at most chunk_size rows, reading only that slice of each column."""
+        columns = [c for c in (columns or self.columns) if c not in exclude]
+        dtype = dtype or np.result_type(*(self[c].dtype for c in columns))
+        for start in range(0, self.n_rows, chunk_size):
+            stop = min(start + chunk_size, self.n_rows)
+            out = np.empty((stop - start, len(columns)), dtype=dtype)
+            for j, name in enumerate(columns):
+                out[:, j] = self[name][start:stop]
+            yield out
+
+    def to_frame(self, columns=None):
+        """pandas DataFrame of the (downcast) columns."""
+        import pandas as pd
+
+        return pd.DataFrame({c: self[c] for c in (columns or self.columns)})
+
+def _cache_dir_for(csv_path: Path, cache_root=None) -> Path:
+    return Path(cache_root or csv_path.parent / ".dataset_cache") / csv_path.stem
+
+def _read_manifest(cache_dir: Path):
+    try:
+        with open(cache_dir / "manifest.json") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _is_fresh(manifest, csv_path: Path, stat, options: dict, verify: bool) -> bool:
+    if manifest is None or manifest.get("version") != CACHE_VERSION or manifest.get("options") != options:
+        return False
+    if not verify and manifest["size"] == stat.st_size and manifest["mtime_ns"] == stat.st_mtime_ns:
+        return True
+    return manifest["sha256"] == file_digest(csv_path)
+
+def build_cache(csv_path, cache_dir, sep: str = ",", float_dtype=np.float32) -> dict:
+    """Parse the CSV once and write one .npy per column plus manifest.json; returns the manifest."""
+    import pandas as pd
+
+    csv_path, cache_dir = Path(csv_path), Path(cache_dir)
+    stat = csv_path.stat()
+    digest = file_digest(csv_path)
+    df = pd.read_csv(csv_path, sep=sep)
+    cache_dir.parent.mkdir(parents=True, exist_ok=True)
+    tmp = Path(tempfile.mkdtemp(prefix=cache_dir.name + ".", dir=cache_dir.parent))
+    try:
+        columns = []
+        for i, name in enumerate(df.columns):
+            values = downcast(df[name].to_numpy(), float_dtype)
+            file = f"{i:04d}.npy"
+            np.save(tmp / file, values, allow_pickle=False)
+            columns.append({"name": str(name), "file": file, "dtype": values.dtype.str})
+        manifest = {
+            "version": CACHE_VERSION,
+            "source": csv_path.name,
+            "sha256": digest,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "n_rows": len(df),
+            "options": {"sep": sep, "float_dtype": np.dtype(float_dtype).str if float_dtype else None},
+            "columns": columns,
+        }
+        with open(tmp / "manifest.json", "w") as f:
+            json.dump(manifest, f, indent=1)
+        # Swap the finished directory in, so readers never see a half-written cache
+        if cache_dir.exists():
+            shutil.rmtree(cache_dir)
+        os.replace(tmp, cache_dir)
+    except BaseException:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+    return manifest
+
+def load_dataset(csv_path, sep: str = ",", float_dtype=np.float32, cache_root=None, verify: bool = False) -> ColumnarDataset:
+    """Memory-mapped columns of csv_path, building or refreshing the binary cache if needed.
+
+    `verify=True` always re-hashes the source instead of trusting an
+    unchanged size and mtime. `float_dtype=None` keeps float64 columns.
+    """
+    csv_path = Path(csv_path)
+    cache_dir = _cache_dir_for(csv_path, cache_root)
+    options = {"sep": sep, "float_dtype": np.dtype(float_dtype).str if float_dtype else None}
+    stat = csv_path.stat()
+    manifest = _read_manifest(cache_dir)
+    if not _is_fresh(manifest, csv_path, stat, options, verify):
+        manifest = build_cache(csv_path, cache_dir, sep=sep, float_dtype=float_dtype)
+    elif manifest["size"] != stat.st_size or manifest["mtime_ns"] != stat.st_mtime_ns:
+        # Same content under a new mtime (e.g. a fresh checkout): remember the new stat
+        manifest.update(size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+        with open(cache_dir / "manifest.json", "w") as f:
+            json.dump(manifest, f, indent=1)
+    return ColumnarDataset(cache_dir, manifest)
+
+if __name__ == "__main__":
+    import time
+
+    here = Path(__file__).resolve().parent
+    for name, sep in [("winequality-red.csv", ";"), ("winequality-white.csv", ";"), ("creditcard.csv", ",")]:
+        path = here / name
+        if not path.exists() or path.stat().st_size == 0:
+            print(f"{name}: missing or empty (fetch it with `git lfs pull`)")
+            continue
+        start = time.perf_counter()
+        data = load_dataset(path, sep=sep)
+        elapsed = time.perf_counter() - start
+        nbytes = sum(data[c].nbytes for c in data.columns)
+        print(f"{name}: {data.n_rows} rows x {len(data.columns)} columns, "
+              f"{nbytes / 1e6:.1f} MB cached, opened in {elapsed * 1e3:.1f} ms")
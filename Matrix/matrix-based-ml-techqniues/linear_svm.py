@@ -0,0 +1,208 @@
+"""
+linear_svm.py
+-------------
+Linear SVM trained in the primal/dual without ever forming a kernel matrix.
+
+A linear SVM only needs dot products w . x_i, so training costs
+O(n_samples * n_features) per epoch instead of the O(n^2) kernel matrix a
+general SVC builds:
+- solver="dcd": dual coordinate descent (Hsieh et al. 2008, the LIBLINEAR
+  algorithm). Each step updates one dual variable alpha_i and keeps
+  w = sum_i alpha_i y_i x_i current, using the cached diagonal Q_ii = ||x_i||^2;
+  variables stuck at 0 or C are shrunk out of later sweeps.
+- solver="sgd": mini-batch Pegasos on the primal hinge loss, fully
+  vectorized per batch; the averaged iterate is returned.
+
+`FoldCache` standardizes a training fold once, appends the bias column and
+caches the squared row norms (the Gram diagonal), then fits a whole C path
+on it, warm-starting each C from the previous dual solution.
+`cross_validate` spreads the folds over a process pool.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+import numpy as np
+
+def dual_coordinate_descent(Xb, y, C: float, loss: str = "hinge", alpha=None, sq_norms=None,
+                            max_iter: int = 1000, tol: float = 0.1, seed=0):
+    """Solve the L1- or L2-loss SVM dual by coordinate descent; returns (w, alpha, n_epochs).
+
+    Xb already includes the bias column; y is in {-1, +1}. `alpha` warm-starts
+    the solve (clipped to the new box [0, C]), `sq_norms` reuses cached ||x_i||^2.
+    """
+    n = len(Xb)
+    upper, diag = (C, 0.0) if loss == "hinge" else (np.inf, 0.5 / C)
+    alpha = np.zeros(n) if alpha is None else np.minimum(alpha, upper)
+    q_ii = (np.einsum("ij,ij->i", Xb, Xb) if sq_norms is None else sq_norms) + diag
+    w = Xb.T @ (alpha * y)
+    rng = np.random.default_rng(seed)
+    # Shrinking (as in LIBLINEAR): variables stuck at a bound leave the active set
+    active = np.arange(n)
+    pg_max_old, pg_min_old = np.inf, -np.inf
+    for epoch in range(1, max_iter + 1):
+        pg_max, pg_min = -np.inf, np.inf
+        keep = []
+        for i in rng.permutation(active):
+            a, yi, xi = alpha[i], y[i], Xb[i]
+            g = yi * (w @ xi) - 1.0 + diag * a
+            if a == 0.0:
+                if g > pg_max_old:
+                    continue
+                pg = min(g, 0.0)
+            elif a == upper:
+                if g < pg_min_old:
+                    continue
+                pg = max(g, 0.0)
+            else:
+                pg = g
+            keep.append(i)
+            pg_max, pg_min = max(pg_max, pg), min(pg_min, pg)
+            if pg != 0.0 and q_ii[i] > 0.0:
+                alpha[i] = min(max(a - g / q_ii[i], 0.0), upper)
+                w += (alpha[i] - a) * yi * xi
+        active = np.array(keep, dtype=np.int64)
+        if pg_max - pg_min < tol:
+            if len(active) == n:
+                break
+            # Converged on the shrunk set: re-check every variable before stopping
+            active = np.arange(n)
+            pg_max_old, pg_min_old = np.inf, -np.inf
+            continue
+        pg_max_old = pg_max if pg_max > 0 else np.inf
+        pg_min_old = pg_min if pg_min < 0 else -np.inf
+    return w, alpha, epoch
+
+def pegasos_sgd(Xb, y, C: float, batch_size: int = 256, n_epochs: int = 20, seed=0):
+    """Mini-batch Pegasos for the primal hinge loss with lambda = 1 / (C n); returns the averaged w."""
+    n, d = Xb.shape
+    lam = 1.0 / (C * n)
+    rng = np.random.default_rng(seed)
+    w, w_avg, t = np.zeros(d), np.zeros(d), 0
+    for _ in range(n_epochs):
+        perm = rng.permutation(n)
+        for start in range(0, n, batch_size):
+            batch = perm[start:start + batch_size]
+            t += 1
+            eta = 1.0 / (lam * t)
+            violated = batch[y[batch] * (Xb[batch] @ w) < 1.0]
+            w *= 1.0 - eta * lam
+            w += (eta / len(batch)) * (y[violated] @ Xb[violated])
+            w_avg += (w - w_avg) / t
+    return w_avg
+
+class LinearSVM:
+    """Binary linear SVM (hinge or squared-hinge loss) with optional standardization."""
+
+    def __init__(self, C: float = 1.0, solver: str = "dcd", loss: str = "hinge", standardize: bool = True,
+                 max_iter: int = 1000, tol: float = 0.1, batch_size: int = 256, n_epochs: int = 20, seed=0):
+        if solver not in ("dcd", "sgd"):
+            raise ValueError(f"unknown solver {solver!r}; use 'dcd' or 'sgd'")
+        if loss not in ("hinge", "squared_hinge"):
+            raise ValueError(f"unknown loss {loss!r}; use 'hinge' or 'squared_hinge'")
+        self.C = C
+        self.solver = solver
+        self.loss = loss
+        self.standardize = standardize
+        self.max_iter = max_iter
+        self.tol = tol
+        self.batch_size = batch_size
+        self.n_epochs = n_epochs
+        self.seed = seed
+
+    def fit(self, X, y, cache=None, alpha=None):
+        """Fit on (X, y), or on a prebuilt FoldCache (X and y are then ignored)."""
+        cache = cache or FoldCache(X, y, self.standardize)
+        self.classes_, self.mean_, self.scale_ = cache.classes, cache.mean, cache.scale
+        if self.solver == "dcd":
+            w, self.alpha_, self.n_iter_ = dual_coordinate_descent(
+                cache.Xb, cache.y, self.C, self.loss, alpha, cache.sq_norms, self.max_iter, self.tol, self.seed
+            )
+        else:
+            w = pegasos_sgd(cache.Xb, cache.y, self.C, self.batch_size, self.n_epochs, self.seed)
+        self.coef_, self.intercept_ = w[:-1], w[-1]
+        return self
+
+    def decision_function(self, X) -> np.ndarray:
+        return ((np.asarray(X, dtype=np.float64) - self.mean_) / self.scale_) @ self.coef_ + self.intercept_
+
+    def predict(self, X) -> np.ndarray:
+        return self.classes_[(self.decision_function(X) > 0).astype(int)]
+
+class FoldCache:
+    """A training fold prepared once: standardized features + bias column, labels in {-1, +1}, row norms."""
+
+    def __init__(self, X, y, standardize: bool = True):
+        X = np.asarray(X, dtype=np.float64)
+        self.classes, y_idx = np.unique(y, return_inverse=True)
+        if len(self.classes) != 2:
+            raise ValueError(f"LinearSVM is binary; got {len(self.classes)} classes")
+        self.mean = X.mean(axis=0) if standardize else np.zeros(X.shape[1])
+        std = X.std(axis=0) if standardize else np.ones(X.shape[1])
+        self.scale = np.where(std > 0, std, 1.0)
+        self.Xb = np.hstack([(X - self.mean) / self.scale, np.ones((len(X), 1))])
+        self.y = np.where(y_idx == 1, 1.0, -1.0)
+        self.sq_norms = np.einsum("ij,ij->i", self.Xb, self.Xb)
+
+    def fit_path(self, Cs, **params) -> list:
+        """One LinearSVM per C (ascending C reuses the previous dual solution as a warm start)."""
+        models, alpha = {}, None
+        for C in sorted(Cs):
+            model = LinearSVM(C=C, **params).fit(None, None, cache=self, alpha=alpha)
+            alpha = getattr(model, "alpha_", None)
+            models[C] = model
+        return [models[C] for C in Cs]
+
+class CVResult(NamedTuple):
+    Cs: list
+    scores: np.ndarray   # accuracy, shape (n_folds, len(Cs))
+    best_C: float
+
+def stratified_folds(y, n_splits: int = 5, seed=0) -> list:
+    """Test-index arrays for k stratified folds (each class dealt round-robin after shuffling)."""
+    rng = np.random.default_rng(seed)
+    fold_of = np.empty(len(y), dtype=np.int64)
+    for label in np.unique(y):
+        rows = rng.permutation(np.flatnonzero(y == label))
+        fold_of[rows] = (np.arange(len(rows)) + rng.integers(n_splits)) % n_splits
+    return [np.flatnonzero(fold_of == k) for k in range(n_splits)]
+
+def _score_fold(X, y, test, Cs, params) -> np.ndarray:
+    train = np.setdiff1d(np.arange(len(y)), test)
+    models = FoldCache(X[train], y[train], params.pop("standardize", True)).fit_path(Cs, **params)
+    return np.array([np.mean(m.predict(X[test]) == y[test]) for m in models])
+
+def cross_validate(X, y, Cs=(0.01, 0.1, 1.0, 10.0), n_splits: int = 5, n_workers: int = 1, seed=0, **params) -> CVResult:
+    """k-fold accuracy of LinearSVM for every C, one fold per worker process.
+
+    Workers use the default start method, so call this from under an
+    `if __name__ == "__main__":` guard when n_workers > 1.
+    """
+    X, y, Cs = np.asarray(X, dtype=np.float64), np.asarray(y), list(Cs)
+    folds = stratified_folds(y, n_splits, seed)
+    tasks = [(X, y, test, Cs, dict(params, seed=seed)) for test in folds]
+    if n_workers <= 1:
+        scores = [_score_fold(*task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(min(n_workers, n_splits)) as pool:
+            scores = list(pool.map(_score_fold, *zip(*tasks)))
+    scores = np.array(scores)
+    return CVResult(Cs, scores, Cs[int(np.argmax(scores.mean(axis=0)))])
+
+if __name__ == "__main__":
+    import os
+    import time
+
+    rng = np.random.default_rng(0)
+    n, d = 20_000, 30
+    X = rng.standard_normal((n, d))
+    y = (X @ rng.standard_normal(d) + 0.5 * rng.standard_normal(n) > 0).astype(int)
+
+    for solver in ("dcd", "sgd"):
+        start = time.perf_counter()
+        model = LinearSVM(C=0.1, solver=solver).fit(X, y)
+        print(f"{solver}: fit {n:,} x {d} in {time.perf_counter() - start:.2f}s, "
+              f"train accuracy {np.mean(model.predict(X) == y):.4f}")
+
+    start = time.perf_counter()
+    cv = cross_validate(X, y, Cs=(0.001, 0.01, 0.1), n_workers=os.cpu_count() or 1)
+    print(f"5-fold CV over C={cv.Cs} in {time.perf_counter() - start:.2f}s: "
+          f"mean accuracy {cv.scores.mean(axis=0).round(4)}, best C={cv.best_C}")
@@ -3,28 +3,35 @@ Dataset: Wine Quality
 Goal: Reduce dimensionality for visualization 
 Matrix Insight: PCA decomposes feature matrix into orthogonal components
 
-
-
+The CSV is read through the dataset_cache column cache and fed to
+streaming_pca in row chunks (streaming mean/variance, incremental PCA, lazy
+projection), so the same pipeline works on tables larger than memory. The
+figure is rendered headlessly to $PLOT_OUTPUT_DIR (default ./figures).
 """
-import pandas as pd
-from sklearn.preprocessing import StandardScaler
-from sklearn.decomposition import PCA
-import matplotlib.pyplot as plt
-import seaborn as sns
+import sys
+from pathlib import Path
+import numpy as np
+
+HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(HERE.parents[1]))  # repo root, for plot_rendering
+from plot_rendering import FigureJob, draw_scatter, render_figures
+from dataset_cache import load_dataset
+from streaming_pca import StreamingPCA
 
-df = pd.read_csv("/workspaces/basic_mathematics/Matrix/matrix-based-ml-techqniues/winequality-red.csv", sep=";")
-X = df.drop("quality", axis=1)
-y = df["quality"]
+if __name__ == "__main__":
+    # Parsed once, then memory-mapped from the binary column cache
+    data = load_dataset(HERE / "winequality-red.csv", sep=";")
+    y = data["quality"]
+    chunks = lambda: data.iter_chunks(chunk_size=500, exclude=["quality"])
 
-# Standardize and apply PCA
-X_scaled = StandardScaler().fit_transform(X)
-pca = PCA(n_components=2)
-X_pca = pca.fit_transform(X_scaled)
+    # Standardize and apply PCA, one chunk at a time
+    pca = StreamingPCA(n_components=2, solver="incremental").fit(chunks)
+    X_pca = np.concatenate(list(pca.transform_chunks(chunks)))
+    print(f"Explained variance ratio: {pca.explained_variance_ratio_.round(3)}")
 
-# Plot PCA
-sns.scatterplot(x=X_pca[:,0], y=X_pca[:,1], hue=y, palette="Spectral")
-plt.title("PCA Projection of Wine Quality")
-plt.xlabel("PC1")
-plt.ylabel("PC2")
-plt.show()
-plt.savefig("/workspaces/basic_mathematics/Matrix/matrix-based-ml-techqniues/winequality-red.png")
\ No newline at end of file
+    # Plot PCA
+    job = FigureJob("winequality-red.png", draw_scatter,
+                    dict(x=X_pca[:, 0], y=X_pca[:, 1], hue=y,
+                         title="PCA Projection of Wine Quality", xlabel="PC1", ylabel="PC2"))
+    for path in render_figures([job]):
+        print(f"Saved {path}")
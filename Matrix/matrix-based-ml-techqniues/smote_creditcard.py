@@ -1,62 +1,74 @@
 """
 Dataset: Credit Card Fraud Detection Goal: Balance imbalanced fraud data using SMOTE Matrix Insight: SMOTE interpolates minority class vectors in feature space
 https://www.kaggle.com/datasets/mlg-ulb/creditcardfraud
+
+The CSV is read through the dataset_cache column cache, oversampled with the
+in-house smote_sampler (synthetic rows are streamed in chunks, never stacked
+into one resampled matrix), and both figures are rendered headlessly, in
+parallel, to $PLOT_OUTPUT_DIR (default ./figures).
 """
-import pandas as pd
-from imblearn.over_sampling import SMOTE
-from sklearn.model_selection import train_test_split
-import matplotlib.pyplot as plt
-import seaborn as sns
+import sys
+from pathlib import Path
+import numpy as np
+from sklearn.datasets import make_classification
 
-df = pd.read_csv("/workspaces/basic_mathematics/Matrix/matrix-based-ml-techqniues/creditcard.csv")
-X = df.drop("Class", axis=1)
-y = df["Class"]
+HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(HERE.parents[1]))  # repo root, for plot_rendering
+from plot_rendering import FigureJob, draw_counts, render_figures, subsample_indices
+from dataset_cache import load_dataset
+from smote_sampler import SMOTESampler
 
-# Apply SMOTE
-smote = SMOTE(random_state=42)
-X_resampled, y_resampled = smote.fit_resample(X, y)
+def draw_smote(ax, X, y, synthetic_samples, origins, max_points=20_000, max_lines=2_000):
+    """Majority, minority and synthetic points with interpolation lines, subsampled for large inputs."""
+    majority, original_minority = X[y == 0], X[y == 1]
+    majority = majority[subsample_indices(len(majority), max_points)]
+    shown = synthetic_samples[subsample_indices(len(synthetic_samples), max_points)]
+    ax.scatter(majority[:, 0], majority[:, 1], label="Majority", alpha=0.5)
+    ax.scatter(original_minority[:, 0], original_minority[:, 1], label="Minority", color='blue')
+    ax.scatter(shown[:, 0], shown[:, 1], label="Synthetic", color='green', marker='*')
 
-# Plot class distribution
-sns.countplot(x=y_resampled, palette="Set2")
-plt.title("Resampled Class Distribution (SMOTE)")
-plt.show()
-plt.savefig("/workspaces/basic_mathematics/Matrix/matrix-based-ml-techqniues/creditcard.png")
+    # Optional: draw interpolation lines from each sample's true origin, as one line collection
+    lines = subsample_indices(len(synthetic_samples), max_lines)
+    orig = X[origins[lines]]
+    synth = synthetic_samples[lines]
+    segments = np.full((3 * len(lines), 2), np.nan)
+    segments[0::3], segments[1::3] = orig, synth
+    ax.plot(segments[:, 0], segments[:, 1], 'k--', alpha=0.3)
 
+    ax.set_title("SMOTE: Synthetic Sample Generation via Vector Interpolation")
+    ax.set_xlabel("Feature 1")
+    ax.set_ylabel("Feature 2")
+    ax.legend()
+    ax.grid(True)
 
-#------------------
-import numpy as np
-import matplotlib.pyplot as plt
-from sklearn.datasets import make_classification
-from imblearn.over_sampling import SMOTE
-
-# Create imbalanced dataset
-X, y = make_classification(n_classes=2, weights=[0.9, 0.1], n_features=2, n_informative=2, n_redundant=0, random_state=42)
-
-# Apply SMOTE
-smote = SMOTE(k_neighbors=3, random_state=42)
-X_res, y_res = smote.fit_resample(X, y)
-
-# Separate original and synthetic samples
-original_minority = X[y == 1]
-synthetic_samples = X_res[len(X):][y_res[len(X):] == 1]
-
-# Plot
-plt.figure(figsize=(8,6))
-plt.scatter(X[y == 0][:,0], X[y == 0][:,1], label="Majority", alpha=0.5)
-plt.scatter(original_minority[:,0], original_minority[:,1], label="Minority", color='blue')
-plt.scatter(synthetic_samples[:,0], synthetic_samples[:,1], label="Synthetic", color='green', marker='*')
-
-# Optional: draw interpolation lines
-for i in range(len(synthetic_samples)):
-    # Randomly pair with original for illustration
-    orig = original_minority[i % len(original_minority)]
-    synth = synthetic_samples[i]
-    plt.plot([orig[0], synth[0]], [orig[1], synth[1]], 'k--', alpha=0.3)
-
-plt.title("SMOTE: Synthetic Sample Generation via Vector Interpolation")
-plt.xlabel("Feature 1")
-plt.ylabel("Feature 2")
-plt.legend()
-plt.grid(True)
-plt.show()
-plt.savefig("/workspaces/basic_mathematics/Matrix/matrix-based-ml-techqniues/creditcard_02.png")
+if __name__ == "__main__":
+    # Parsed once, then memory-mapped from the binary column cache (float32 features, int8 labels)
+    data = load_dataset(HERE / "creditcard.csv")
+    X = data.matrix(exclude=["Class"])
+    y = data["Class"]
+
+    # Apply SMOTE, streaming the synthetic rows instead of building X_resampled
+    sampler = SMOTESampler(k_neighbors=5, seed=42).fit(X, y)
+    n_synthetic = 0
+    for chunk in sampler.iter_chunks():
+        n_synthetic += len(chunk.X)  # write the chunk out or feed a model here
+    y_resampled = np.concatenate([y, np.full(n_synthetic, sampler.minority_label, dtype=y.dtype)])
+
+    #------------------
+    # Create imbalanced dataset
+    X, y = make_classification(n_classes=2, weights=[0.9, 0.1], n_features=2, n_informative=2, n_redundant=0, random_state=42)
+
+    # Apply SMOTE; each chunk records the original row every synthetic sample came from
+    chunks = list(SMOTESampler(k_neighbors=3, seed=42).fit(X, y).iter_chunks())
+    synthetic_samples = np.concatenate([c.X for c in chunks])
+    origins = np.concatenate([c.base for c in chunks])
+
+    # Plot both figures in parallel
+    jobs = [
+        FigureJob("creditcard.png", draw_counts,
+                  dict(labels=y_resampled, title="Resampled Class Distribution (SMOTE)")),
+        FigureJob("creditcard_02.png", draw_smote,
+                  dict(X=X, y=y, synthetic_samples=synthetic_samples, origins=origins), figsize=(8, 6)),
+    ]
+    for path in render_figures(jobs, n_workers=2):
+        print(f"Saved {path}")
@@ -0,0 +1,195 @@
+"""
+streaming_pca.py
+----------------
+Standardization and PCA over feature tables that arrive in row chunks.
+
+Pass 1 folds every chunk into `RunningMoments` (count, mean and sum of
+squared deviations per feature, float64). Partial moments from separate
+chunks, files or workers merge exactly with Chan et al.'s pairwise update:
+
+    delta = mean_b - mean_a
+    M2    = M2_a + M2_b + delta^2 * n_a * n_b / (n_a + n_b)
+
+Later passes fit the top components of the standardized data:
+- solver="incremental" (one pass): keep a small SVD of everything seen so
+  far and update it with each standardized chunk (Ross et al. 2008). Exact
+  when `n_components + oversample` covers all features, approximate otherwise.
+- solver="randomized" (n_iter + 1 passes): subspace iteration on the
+  covariance, accumulating Z^T (Z Q) chunk by chunk, so memory is d x l.
+
+`transform_chunks` then projects chunks lazily, one at a time.
+"""
+from typing import Callable, Iterable
+import numpy as np
+
+class RunningMoments:
+    """Per-feature count, mean and M2 (sum of squared deviations), mergeable across chunks."""
+
+    def __init__(self, n_features: int):
+        self.count = 0
+        self.mean = np.zeros(n_features)
+        self.m2 = np.zeros(n_features)
+
+    def update(self, chunk) -> "RunningMoments":
+        """Fold in a (rows x features) chunk; float32 input is accumulated in float64."""
+        chunk = np.asarray(chunk)
+        if len(chunk) == 0:
+            return self
+        other = RunningMoments(chunk.shape[1])
+        other.count = len(chunk)
+        other.mean = chunk.mean(axis=0, dtype=np.float64)
+        other.m2 = ((chunk - other.mean) ** 2).sum(axis=0)
+        return self.merge(other)
+
+    def merge(self, other: "RunningMoments") -> "RunningMoments":
+        """Combine with moments of a disjoint set of rows (Chan's pairwise update)."""
+        n = self.count + other.count
+        if other.count == 0:
+            return self
+        delta = other.mean - self.mean
+        self.mean = self.mean + delta * (other.count / n)
+        self.m2 = self.m2 + other.m2 + delta ** 2 * (self.count * other.count / n)
+        self.count = n
+        return self
+
+    def variance(self, ddof: int = 0) -> np.ndarray:
+        return self.m2 / (self.count - ddof)
+
+    def std(self, ddof: int = 0) -> np.ndarray:
+        return np.sqrt(self.variance(ddof))
+
+def iter_rows(X, chunk_size: int = 100_000):
+    """Yield row slices of an array or np.memmap without copying the whole array."""
+    for start in range(0, len(X), chunk_size):
+        yield X[start:start + chunk_size]
+
+def _flip_signs(components: np.ndarray) -> np.ndarray:
+    """Make the largest-magnitude loading of each component positive, for reproducible signs."""
+    idx = np.argmax(np.abs(components), axis=1)
+    return components * np.sign(components[np.arange(len(components)), idx])[:, None]
+
+class StreamingPCA:
+    """Standardize-then-PCA fitted from a re-iterable source of row chunks.
+
+    `fit` takes either an array (chunked with `chunk_size`) or a zero-argument
+    callable returning a fresh iterator of chunks, since the moments pass and
+    the component passes each read the data once.
+    """
+
+    def __init__(self, n_components: int = 2, solver: str = "incremental", standardize: bool = True,
+                 chunk_size: int = 100_000, oversample: int = 10, n_iter: int = 4, seed=0):
+        if solver not in ("incremental", "randomized"):
+            raise ValueError(f"unknown solver {solver!r}; use 'incremental' or 'randomized'")
+        self.n_components = n_components
+        self.solver = solver
+        self.standardize = standardize
+        self.chunk_size = chunk_size
+        self.oversample = oversample
+        self.n_iter = n_iter
+        self.seed = seed
+
+    def _source(self, chunks) -> Callable[[], Iterable]:
+        if callable(chunks):
+            return chunks
+        return lambda: iter_rows(chunks, self.chunk_size)
+
+    def _scale(self, chunk) -> np.ndarray:
+        return (np.asarray(chunk, dtype=np.float64) - self.mean_) / self.scale_
+
+    def fit_moments(self, chunks) -> RunningMoments:
+        """Pass 1: streaming mean/variance; sets mean_ and scale_."""
+        moments = None
+        for chunk in self._source(chunks)():
+            moments = moments or RunningMoments(np.shape(chunk)[1])
+            moments.update(chunk)
+        return self.set_moments(moments)
+
+    def set_moments(self, moments: RunningMoments) -> RunningMoments:
+        """Use precomputed (e.g. merged) moments instead of running pass 1."""
+        self.moments_ = moments
+        self.n_samples_ = moments.count
+        self.mean_ = moments.mean
+        std = moments.std()
+        self.scale_ = np.where(std > 0, std, 1.0) if self.standardize else np.ones_like(std)
+        return moments
+
+    def partial_fit(self, chunk) -> "StreamingPCA":
+        """Incremental solver: fold one chunk into the running SVD (moments must already be set)."""
+        Z = self._scale(chunk)
+        if getattr(self, "_basis", None) is not None:
+            Z = np.vstack([self._singular[:, None] * self._basis, Z])
+        _, s, Vt = np.linalg.svd(Z, full_matrices=False)
+        rank = min(self.n_components + self.oversample, len(s))
+        self._singular, self._basis = s[:rank], Vt[:rank]
+        return self
+
+    def _fit_randomized(self, source):
+        d = len(self.mean_)
+        width = min(self.n_components + self.oversample, d)
+        Q, _ = np.linalg.qr(np.random.default_rng(self.seed).standard_normal((d, width)))
+        for i in range(self.n_iter + 1):
+            Y = np.zeros((d, width))
+            for chunk in source():
+                Z = self._scale(chunk)
+                Y += Z.T @ (Z @ Q)
+            if i < self.n_iter:
+                Q, _ = np.linalg.qr(Y)
+        # Rayleigh-Ritz on the final subspace: eigenpairs of Q^T C Q
+        evals, W = np.linalg.eigh(Q.T @ Y)
+        order = np.argsort(evals)[::-1]
+        self._singular = np.sqrt(np.clip(evals[order], 0, None))
+        self._basis = (Q @ W[:, order]).T
+
+    def fit(self, chunks) -> "StreamingPCA":
+        source = self._source(chunks)
+        self.fit_moments(source)
+        self._basis = None
+        if self.solver == "incremental":
+            for chunk in source():
+                self.partial_fit(chunk)
+        else:
+            self._fit_randomized(source)
+        return self.finalize()
+
+    def finalize(self) -> "StreamingPCA":
+        """Publish components_ and explained variance from the running state."""
+        k = self.n_components
+        self.components_ = _flip_signs(self._basis[:k])
+        self.singular_values_ = self._singular[:k]
+        self.explained_variance_ = self.singular_values_ ** 2 / (self.n_samples_ - 1)
+        total = self.moments_.m2 / self.scale_ ** 2  # total sum of squares of the scaled data
+        self.explained_variance_ratio_ = self.singular_values_ ** 2 / total.sum()
+        return self
+
+    def transform(self, chunk) -> np.ndarray:
+        return self._scale(chunk) @ self.components_.T
+
+    def transform_chunks(self, chunks):
+        """Lazily project each chunk; yields (rows x n_components) arrays."""
+        for chunk in self._source(chunks)():
+            yield self.transform(chunk)
+
+if __name__ == "__main__":
+    import time
+
+    rng = np.random.default_rng(0)
+    n, d = 1_000_000, 40
+    latent = rng.standard_normal((n, 3)) * [5.0, 3.0, 2.0]
+    X = (latent @ rng.standard_normal((3, d)) + rng.standard_normal((n, d))).astype(np.float32)
+    X *= rng.uniform(0.1, 100, d).astype(np.float32)  # very different feature scales
+
+    # Moments of two halves, computed separately and merged
+    a = RunningMoments(d).update(X[: n // 2])
+    b = RunningMoments(d).update(X[n // 2:])
+    merged = a.merge(b)
+    print("Merged mean/std match one pass:",
+          np.allclose(merged.mean, X.mean(axis=0, dtype=np.float64)),
+          np.allclose(merged.std(), X.std(axis=0, dtype=np.float64)))
+
+    for solver in ("incremental", "randomized"):
+        start = time.perf_counter()
+        pca = StreamingPCA(n_components=2, solver=solver, chunk_size=50_000).fit(X)
+        print(f"{solver:11s} {time.perf_counter() - start:.2f}s  "
+              f"explained variance ratio {pca.explained_variance_ratio_.round(4)}")
+    first = next(pca.transform_chunks(X))
+    print("First projected chunk:", first.shape)
@@ -1,25 +1,41 @@
 """
 Dataset: Breast Cancer Wisconsin (Diagnostic) Goal: Classify tumors using SVM Matrix Insight: SVM uses dot products of feature vectors to find optimal hyperplane
 https://scikit-learn.org/stable/modules/generated/sklearn.datasets.load_breast_cancer.html
+
+C is chosen by 5-fold cross-validation of linear_svm.LinearSVM (dual coordinate
+descent, no kernel matrix) with the folds run on a process pool, and the
+confusion matrix is rendered headlessly to $PLOT_OUTPUT_DIR (default ./figures).
 """
+import os
+import sys
+from pathlib import Path
 from sklearn.datasets import load_breast_cancer
 from sklearn.model_selection import train_test_split
-from sklearn.svm import SVC
-from sklearn.metrics import ConfusionMatrixDisplay, classification_report
-import matplotlib.pyplot as plt
+from sklearn.metrics import classification_report, confusion_matrix
+
+HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(HERE.parents[1]))  # repo root, for plot_rendering
+from plot_rendering import FigureJob, draw_confusion_matrix, render_figures
+from linear_svm import LinearSVM, cross_validate
 
-data = load_breast_cancer()
-X = data.data
-y = data.target
+if __name__ == "__main__":
+    data = load_breast_cancer()
+    X = data.data
+    y = data.target
 
-X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.3, random_state=42)
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.3, random_state=42)
 
-svm = SVC(kernel='linear')
-svm.fit(X_train, y_train)
-y_pred = svm.predict(X_test)
+    # Pick C by k-fold CV: each fold is standardized once and reused for every C
+    cv = cross_validate(X_train, y_train, Cs=(0.01, 0.1, 1.0, 10.0), n_splits=5, n_workers=os.cpu_count() or 1)
+    print(f"CV accuracy per C {cv.Cs}: {cv.scores.mean(axis=0).round(4)} -> C={cv.best_C}")
 
-print(classification_report(y_test, y_pred))
-ConfusionMatrixDisplay.from_estimator(svm, X_test, y_test)
-plt.title("SVM Confusion Matrix")
-plt.show()
+    svm = LinearSVM(C=cv.best_C)
+    svm.fit(X_train, y_train)
+    y_pred = svm.predict(X_test)
 
+    print(classification_report(y_test, y_pred))
+    job = FigureJob("svm_confusion_matrix.png", draw_confusion_matrix,
+                    dict(matrix=confusion_matrix(y_test, y_pred), labels=svm.classes_, title="SVM Confusion Matrix"),
+                    figsize=(6, 5))
+    for path in render_figures([job]):
+        print(f"Saved {path}")
@@ -7,6 +7,7 @@ ML Context: In linear regression or PCA, the transpose is used to compute the co
 """
 
 import numpy as np
+from streaming_covariance import StreamingCovariance
 
 # Business Scenario: Sales Data Reporting
 # Sales data: Rows as customers, columns as products purchased.
@@ -21,13 +22,16 @@ print("Interpretation: Stakeholders can now easily sum per product (e.g., total
 # ML Scenario: Computing Covariance for Feature Analysis
 # Customer features: Age, Income, Spending Score (3 samples x 3 features)
 features = np.array([[25, 50000, 300], [35, 70000, 500], [45, 90000, 700]])
-mean_features = np.mean(features, axis=0)  # Mean per feature
-centered = features - mean_features  # Center data
 
-# Covariance = (Centered^T * Centered) / (n-1)
-covariance = np.dot(centered.T, centered) / (features.shape[0] - 1)
+# Covariance = (Centered^T * Centered) / (n-1), accumulated chunk by chunk
+# (here one customer at a time) without ever building the centered table
+estimator = StreamingCovariance(n_features=features.shape[1])
+for chunk in np.array_split(features, 3):
+    estimator.update(chunk)
+covariance = estimator.covariance()
 print("\nML: Covariance Matrix for Feature Relationships:")
 print("Original Features:\n", features)
-print("Centered Data:\n", centered)
+print("Mean per Feature:\n", estimator.mean)
 print("Covariance Matrix:\n", covariance)
+print("Correlation Matrix:\n", estimator.correlation())
 print("Interpretation: High off-diagonals indicate correlated features (e.g., age and income), helping stakeholders detect redundancies for better ML models.")
\ No newline at end of file
@@ -4,7 +4,14 @@ matrix_rotation_2d.py
 ---------------------
 Rotate a 2D point (x, y) by theta degrees using a rotation matrix.
 Useful in graphics, gaming, and robotics for transforming coordinates.
+
+`rotate_points` broadcasts N points against M angles in one pass, and
+`rotation_sweep` / `cached_rotation_matrix_2d` memoize rotation matrices
+for angles that repeat (fixed-step sweeps, per-frame loops), so trig is
+not recomputed and no new 2x2 arrays are allocated on a cache hit.
+Cached matrices are read-only; copy them before modifying.
 """
+import functools
 import numpy as np
 import math
 
@@ -14,13 +21,48 @@ def rotation_matrix_2d(theta_degrees: float) -> np.ndarray:
     return np.array([[c, -s],
                      [s,  c]], dtype=float)
 
-def rotate_point(point_xy, theta_degrees):
-    p = np.asarray(point_xy, dtype=float).reshape(2, 1)
+@functools.lru_cache(maxsize=1024)
+def cached_rotation_matrix_2d(theta_degrees: float) -> np.ndarray:
     R = rotation_matrix_2d(theta_degrees)
-    return (R @ p).ravel()
+    R.flags.writeable = False
+    return R
+
+def rotation_matrices_2d(thetas_degrees) -> np.ndarray:
+    """Stack of rotation matrices, shape thetas.shape + (2, 2)."""
+    theta = np.radians(np.asarray(thetas_degrees, dtype=float))
+    c, s = np.cos(theta), np.sin(theta)
+    return np.stack([np.stack([c, -s], axis=-1),
+                     np.stack([s, c], axis=-1)], axis=-2)
+
+@functools.lru_cache(maxsize=64)
+def rotation_sweep(start_degrees: float, step_degrees: float, n_steps: int) -> np.ndarray:
+    """Cached (n_steps, 2, 2) matrices for angles start, start + step, ..."""
+    R = rotation_matrices_2d(start_degrees + step_degrees * np.arange(n_steps))
+    R.flags.writeable = False
+    return R
+
+def apply_rotations(points_xy, R, out=None) -> np.ndarray:
+    """Rotate points (N, 2) by matrices R (..., 2, 2); returns (..., N, 2)."""
+    points = np.asarray(points_xy, dtype=float)
+    return np.matmul(points, np.swapaxes(R, -1, -2), out=out)
+
+def rotate_points(points_xy, thetas_degrees, out=None) -> np.ndarray:
+    """Rotate N points by each of M angles; returns (M, N, 2) (or (N, 2) for a scalar angle)."""
+    return apply_rotations(points_xy, rotation_matrices_2d(thetas_degrees), out=out)
+
+def rotate_point(point_xy, theta_degrees):
+    p = np.asarray(point_xy, dtype=float)
+    R = cached_rotation_matrix_2d(theta_degrees)
+    return R @ p
 
 if __name__ == "__main__":
     point = (2, 3)
     for deg in [30, 90, 180]:
         rp = rotate_point(point, deg)
         print(f"Rotate {point} by {deg:>3}° -> ({rp[0]:.3f}, {rp[1]:.3f})")
+
+    # Sweep a square's corners through 0°, 45°, ..., 315° in one pass
+    square = np.array([[1, 1], [-1, 1], [-1, -1], [1, -1]], dtype=float)
+    swept = apply_rotations(square, rotation_sweep(0, 45, 8))
+    print("Corner 0 along the sweep:")
+    print(np.round(swept[:, 0], 3))
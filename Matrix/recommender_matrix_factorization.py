@@ -9,6 +9,15 @@ Demonstrates matrix multiplication in a recommender workflow:
 
 This mirrors real systems where user and item latent factor matrices
 are multiplied to produce preference scores.
+
+`MatrixFactorizationRecommender` fits the factors once and then scores
+whole blocks of users with a single matrix product, picking the top-N
+items with `argpartition` and masking already-rated items straight from
+a dense or scipy.sparse ratings matrix.
+
+For large matrices `randomized_svd_top_k` finds only the top k factors
+with a randomized range finder, and `fold_in` maps new or re-rated users
+onto the existing item factors without refactoring.
 """
 import numpy as np
 
@@ -19,16 +28,134 @@ def svd_top_k(R: np.ndarray, k: int = 2):
     Vt_k = Vt[:k, :]
     return U_k, S, Vt_k
 
-def recommend_for_user(R: np.ndarray, user_index: int, top_n: int = 3):
-    U_k, S, Vt_k = svd_top_k(R, k=min(2, min(R.shape)))
-    R_hat = U_k @ S @ Vt_k  # reconstructed score matrix
-    user_scores = R_hat[user_index]
+def randomized_svd_top_k(R, k: int = 2, oversample: int = 10, n_iter: int = 2, seed=None):
+    """Approximate top-k SVD of R (dense or scipy.sparse) via a randomized range finder.
+
+    Only products of R with thin (n x (k + oversample)) blocks are formed,
+    so the cost is about O(nnz * (k + oversample) * (n_iter + 1)). More
+    power iterations sharpen the result when the spectrum decays slowly.
+    Returns U_k, S, Vt_k in the same layout as `svd_top_k`.
+    """
+    rng = np.random.default_rng(seed)
+    width = min(k + oversample, min(R.shape))
+    Q, _ = np.linalg.qr(R @ rng.standard_normal((R.shape[1], width)))
+    for _ in range(n_iter):
+        Q, _ = np.linalg.qr(R.T @ Q)
+        Q, _ = np.linalg.qr(R @ Q)
+    B = (R.T @ Q).T  # (width x items), equals Q^T R
+    U_b, s, Vt = np.linalg.svd(B, full_matrices=False)
+    U = Q @ U_b
+    return U[:, :k], np.diag(s[:k]), Vt[:k, :]
+
+def top_n_indices(scores: np.ndarray, top_n: int) -> np.ndarray:
+    """Column indices of the top_n largest scores in each row, best first."""
+    top_n = min(top_n, scores.shape[1])
+    part = np.argpartition(-scores, top_n - 1, axis=1)[:, :top_n]
+    order = np.argsort(-np.take_along_axis(scores, part, axis=1), axis=1, kind="stable")
+    return np.take_along_axis(part, order, axis=1)
+
+class MatrixFactorizationRecommender:
+    """Truncated-SVD recommender that factors the ratings matrix once.
+
+    Scores for a user are (U_k S)[user] @ Vt_k, so a block of users costs
+    one (block x k) @ (k x items) product instead of a fresh SVD each.
+    """
+
+    def __init__(self, k: int = 2, solver: str = "full", oversample: int = 10, n_iter: int = 2, seed=None):
+        if solver not in ("full", "randomized"):
+            raise ValueError(f"unknown solver {solver!r}; use 'full' or 'randomized'")
+        self.k = k
+        self.solver = solver
+        self.oversample = oversample
+        self.n_iter = n_iter
+        self.seed = seed
+
+    def fit(self, R):
+        """Factor R (users x items, 0 = not rated); R may be a scipy.sparse matrix."""
+        sparse = hasattr(R, "tocsr")
+        # Own copy: fold_in updates ratings in place and must not touch the caller's R
+        self.R = R.tocsr(copy=True) if sparse else np.array(R, dtype=float)
+        k = min(self.k, min(R.shape))
+        if self.solver == "randomized":
+            self.U_k, self.S, self.Vt_k = randomized_svd_top_k(
+                self.R, k, oversample=self.oversample, n_iter=self.n_iter, seed=self.seed
+            )
+        else:
+            self.U_k, self.S, self.Vt_k = svd_top_k(self.R.toarray() if sparse else self.R, k=k)
+        self.user_factors = self.U_k * np.diag(self.S)  # U_k @ S without the diagonal product
+        return self
+
+    def fold_in(self, ratings, users=None):
+        """Project rating rows onto the fitted item factors without refactoring.
 
-    # Exclude items already rated (non-zero entries)
-    already = R[user_index] != 0
-    scores = np.where(already, -np.inf, user_scores)  # mask
-    top_items = np.argsort(scores)[::-1][:top_n]
-    return top_items, user_scores[top_items]
+        A user's factor row is ratings @ Vt_k^T (the same as (U_k S)[user]
+        for users seen during fit), so this costs O(nnz(ratings) * k).
+        With `users=None` the rows are appended as new users and their ids
+        are returned; otherwise they replace the ratings of `users`.
+        Item factors are unchanged, so refit periodically as ratings drift.
+        """
+        sparse = hasattr(self.R, "tocsr")
+        if sparse:
+            from scipy import sparse as sp
+
+            ratings = sp.csr_matrix(ratings)
+        else:
+            ratings = np.atleast_2d(np.asarray(ratings, dtype=float))
+        factors = np.asarray(ratings @ self.Vt_k.T)
+        if users is None:
+            users = np.arange(self.R.shape[0], self.R.shape[0] + ratings.shape[0])
+            self.R = sp.vstack([self.R, ratings], format="csr") if sparse else np.vstack([self.R, ratings])
+            self.user_factors = np.vstack([self.user_factors, factors])
+        else:
+            users = np.atleast_1d(users)
+            if sparse:
+                R = self.R.tolil()
+                R[users] = ratings
+                self.R = R.tocsr()
+            else:
+                self.R[users] = ratings
+            self.user_factors[users] = factors
+        return users
+
+    def score_users(self, users) -> np.ndarray:
+        """Reconstructed scores, shape (len(users), n_items)."""
+        return self.user_factors[users] @ self.Vt_k
+
+    def _rated_mask(self, users, scores):
+        if hasattr(self.R, "tocsr"):
+            rows, cols = self.R[users].nonzero()
+            scores[rows, cols] = -np.inf
+        else:
+            scores[self.R[users] != 0] = -np.inf
+
+    def recommend(self, users, top_n: int = 3, exclude_rated: bool = True):
+        """Top-N items and their predicted scores for each user in `users`.
+
+        Returns (items, scores), both of shape (len(users), top_n). Users with
+        fewer than top_n unrated items are padded with item -1 and score -inf.
+        """
+        users = np.atleast_1d(users)
+        user_scores = self.score_users(users)
+        masked = user_scores.copy()
+        if exclude_rated:
+            self._rated_mask(users, masked)
+        items = top_n_indices(masked, top_n)
+        scores = np.take_along_axis(user_scores, items, axis=1)
+        padding = np.take_along_axis(masked, items, axis=1) == -np.inf
+        items[padding], scores[padding] = -1, -np.inf
+        return items, scores
+
+    def recommend_all(self, top_n: int = 3, block_size: int = 4096, exclude_rated: bool = True):
+        """Yield (users, items, scores) for every user, `block_size` users at a time."""
+        n_users = self.user_factors.shape[0]
+        for start in range(0, n_users, block_size):
+            users = np.arange(start, min(start + block_size, n_users))
+            yield (users, *self.recommend(users, top_n, exclude_rated))
+
+def recommend_for_user(R: np.ndarray, user_index: int, top_n: int = 3):
+    model = MatrixFactorizationRecommender(k=2).fit(R)
+    items, scores = model.recommend([user_index], top_n=top_n)
+    return items[0], scores[0]
 
 if __name__ == "__main__":
     # Rows = users, Cols = items
@@ -43,5 +170,18 @@ if __name__ == "__main__":
     user_idx = 0
     items, scores = recommend_for_user(R, user_idx, top_n=2)
     print(f"Top recommendations for user {user_idx}:")
-    for it, sc in zip(items, scores):
+    for it, sc in zip(items[items >= 0], scores[items >= 0]):
         print(f"  Item {it} with predicted score {sc:.3f}")
+
+    # Fit once, then serve every user in blocks
+    model = MatrixFactorizationRecommender(k=2).fit(R)
+    for users, items, scores in model.recommend_all(top_n=1, block_size=2):
+        for u, it, sc in zip(users, items[:, 0], scores[:, 0]):
+            if it < 0:
+                continue  # nothing left to recommend
+            print(f"User {u}: item {it} ({sc:.3f})")
+
+    # A new user arrives: fold them in instead of refactoring R
+    (new_user,) = model.fold_in([[4, 5, 0, 0]])
+    items, scores = model.recommend(new_user, top_n=2)
+    print(f"New user {new_user}: items {items[0].tolist()}")
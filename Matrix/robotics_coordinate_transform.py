@@ -4,6 +4,12 @@ robotics_coordinate_transform.py
 --------------------------------
 Demonstrates 2D homogeneous coordinate transforms for robotics/navigation.
 We build a transform that rotates then translates local points into a global frame.
+
+For point clouds, `transform_points_batch` applies a stack of poses
+(R, t) directly as p @ R^T + t, without building homogeneous copies of
+the points, and can write into a caller-provided `out=` buffer (float32
+inputs stay float32). `homogeneous_transforms` builds many 3x3
+transforms at once from arrays of angles and translations.
 """
 import numpy as np
 import math
@@ -19,12 +25,36 @@ def homogeneous_transform(theta_deg: float, tx: float, ty: float) -> np.ndarray:
     ], dtype=float)
     return T
 
+def homogeneous_transforms(theta_deg, tx, ty, dtype=float) -> np.ndarray:
+    """Vectorized `homogeneous_transform`: (..., 3, 3) transforms from broadcastable arrays."""
+    th = np.radians(np.asarray(theta_deg, dtype=dtype))
+    th, tx, ty = np.broadcast_arrays(th, np.asarray(tx, dtype=dtype), np.asarray(ty, dtype=dtype))
+    c, s = np.cos(th), np.sin(th)
+    T = np.zeros(th.shape + (3, 3), dtype=dtype)
+    T[..., 0, 0], T[..., 0, 1], T[..., 0, 2] = c, -s, tx
+    T[..., 1, 0], T[..., 1, 1], T[..., 1, 2] = s, c, ty
+    T[..., 2, 2] = 1
+    return T
+
 def transform_points(points_xy: np.ndarray, T: np.ndarray) -> np.ndarray:
     """Transform Nx2 points with homogeneous transform T."""
-    N = points_xy.shape[0]
-    homo = np.hstack([points_xy, np.ones((N, 1))])  # Nx3
-    out = (T @ homo.T).T  # Nx3
-    return out[:, :2]
+    return transform_points_batch(points_xy, T[:2, :2], T[:2, 2])
+
+def transform_points_batch(points_xy, R, t, out=None) -> np.ndarray:
+    """Apply rotations R (..., 2, 2) and translations t (..., 2) to points (..., N, 2).
+
+    Leading dimensions broadcast, so one cloud (N, 2) against M poses
+    (M, 2, 2)/(M, 2) gives (M, N, 2). Homogeneous transforms can be split
+    as R = T[..., :2, :2], t = T[..., :2, 2]. The result is written into
+    `out` when given and keeps the points' dtype (e.g. float32).
+    """
+    points_xy = np.asarray(points_xy)
+    dtype = np.result_type(points_xy, np.float32)
+    R = np.asarray(R, dtype=dtype)
+    t = np.asarray(t, dtype=dtype)
+    out = np.matmul(points_xy, np.swapaxes(R, -1, -2), out=out)
+    out += t[..., None, :]
+    return out
 
 if __name__ == "__main__":
     # Local LIDAR detections in robot frame
@@ -39,3 +69,10 @@ if __name__ == "__main__":
     print("Global coordinates:")
     for p_local, p_global in zip(points, global_points):
         print(f"  {p_local} -> {p_global}")
+
+    # Same cloud seen from 4 poses along a path, in float32
+    T_path = homogeneous_transforms([0, 15, 30, 45], tx=[0.0, 0.5, 1.0, 2.0], ty=[0.0, 1.0, 2.0, 3.0],
+                                    dtype=np.float32)
+    out = np.empty((4, len(points), 2), dtype=np.float32)
+    transform_points_batch(points.astype(np.float32), T_path[:, :2, :2], T_path[:, :2, 2], out=out)
+    print("Last pose matches single transform:", np.allclose(out[-1], global_points, atol=1e-5))
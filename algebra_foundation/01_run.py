@@ -5,10 +5,13 @@
 # Run this script to see outputs and learn through examples.
 
 # Step 1: Import Necessary Libraries
-# numpy for numerical computations (logarithms, polynomials)
-# sympy for symbolic algebra (factoring, solving equations)
-import numpy as np
-import sympy as sp
+# The computations live in algebra.py so other code can import them without running this walkthrough.
+# algebra.py uses numpy for numerical computations (logarithms, polynomials)
+# and imports sympy for symbolic algebra (factoring, solving equations) only when first needed.
+from algebra import (add_polynomials, claim_cost, evaluate_polynomial, factor_polynomial,
+                     log_summary, product_rule, quadratic_roots, solve_linear, solve_quadratics,
+                     symbolic_roots)
+from symbolic import compile_numpy
 
 # Step 2: Basic Algebra
 # Basic Algebra involves operations with numbers and variables (e.g., x, y) to solve equations and model relationships.
@@ -23,7 +26,7 @@ import sympy as sp
 print("\n--- Basic Algebra: Solving Linear Equation ---")
 # Equation: 2x + 3 = 7
 # Isolate x: 2x = 7 - 3 => 2x = 4 => x = 2
-x = (7 - 3) / 2
+x = solve_linear(2, 3, 7)
 print(f"Solving 2x + 3 = 7")
 print(f"x = {x}")
 
@@ -46,7 +49,7 @@ product_exp = exp1 + exp2  # Product rule: 2^3 * 2^(-2) = 2^(3 + (-2)) = 2^1
 
 print(f"2^{exp1} = {base ** exp1}")  # 2^3 = 8
 print(f"2^{exp2} = {base ** exp2}")  # 2^(-2) = 1/4
-print(f"Product Rule: 2^{exp1} * 2^{exp2} = 2^{product_exp} = {base ** product_exp}")
+print(f"Product Rule: 2^{exp1} * 2^{exp2} = 2^{product_exp} = {product_rule(base, exp1, exp2)}")
 
 # Step 4: Logarithms
 # Logarithms are the inverse of exponents: if a^b = c, then log_a(c) = b.
@@ -63,9 +66,10 @@ print(f"Product Rule: 2^{exp1} * 2^{exp2} = 2^{product_exp} = {base ** product_e
 print("\n--- Logarithms: Basic Operations ---")
 x = 10
 y = 100
-print(f"Natural log ln({x}) = {np.log(x):.4f}")  # ln(10) ≈ 2.3026
-print(f"Common log log_10({y}) = {np.log10(y):.4f}")  # log_10(100) = 2
-print(f"Product Rule: log({x} * {y}) = log({x}) + log({y}) = {np.log10(x * y):.4f}")
+logs = log_summary(x, y)
+print(f"Natural log ln({x}) = {logs['ln_x']:.4f}")  # ln(10) ≈ 2.3026
+print(f"Common log log_10({y}) = {logs['log10_y']:.4f}")  # log_10(100) = 2
+print(f"Product Rule: log({x} * {y}) = log({x}) + log({y}) = {logs['log10_xy']:.4f}")
 
 # Step 5: Polynomials
 # Polynomials are expressions with terms of the form ax^n, where a is a coefficient and n is a non-negative integer.
@@ -78,12 +82,12 @@ print("\n--- Polynomials: Evaluation and Operations ---")
 # Define polynomial: 2x^2 + 3x + 1
 coeffs = [2, 3, 1]  # Coefficients for x^2, x, constant
 x_val = 2
-poly_value = np.polyval(coeffs, x_val)  # Evaluate at x = 2
+poly_value = evaluate_polynomial(coeffs, x_val)  # Evaluate at x = 2
 print(f"Polynomial 2x^2 + 3x + 1 at x = {x_val} = {poly_value}")
 
 # Add two polynomials: (2x^2 + 3x + 1) + (x^2 + 2x + 4)
 coeffs2 = [1, 2, 4]
-sum_coeffs = np.polyadd(coeffs, coeffs2)
+sum_coeffs = add_polynomials(coeffs, coeffs2)
 print(f"Sum of 2x^2 + 3x + 1 and x^2 + 2x + 4 = {sum_coeffs.tolist()} (3x^2 + 5x + 5)")
 
 # Step 6: Factoring
@@ -93,13 +97,12 @@ print(f"Sum of 2x^2 + 3x + 1 and x^2 + 2x + 4 = {sum_coeffs.tolist()} (3x^2 + 5x
 
 # Example: Factor x^2 - 5x + 6 using sympy
 print("\n--- Factoring: Quadratic Example ---")
-x = sp.Symbol('x')
-poly = x**2 - 5*x + 6
-factored = sp.factor(poly)
+poly = [1, -5, 6]  # x^2 - 5x + 6
+factored = factor_polynomial(poly)
 print(f"Polynomial x^2 - 5x + 6 factors as: {factored}")  # (x - 2)(x - 3)
 
 # Verify by finding roots
-roots = sp.solve(poly, x)
+roots = symbolic_roots(poly)
 print(f"Roots of x^2 - 5x + 6 = 0: {roots}")
 
 # Step 7: Quadratic Equations
@@ -111,25 +114,37 @@ print(f"Roots of x^2 - 5x + 6 = 0: {roots}")
 # Example: Solve x^2 - 5x + 6 = 0
 print("\n--- Quadratic Equations: Solving Example ---")
 a, b, c = 1, -5, 6  # Coefficients
-discriminant = b**2 - 4*a*c
-root1 = (-b + np.sqrt(discriminant)) / (2*a)
-root2 = (-b - np.sqrt(discriminant)) / (2*a)
+discriminant, root1, root2 = quadratic_roots(a, b, c)
 print(f"Quadratic x^2 - 5x + 6 = 0")
 print(f"Discriminant: {discriminant}")
 print(f"Roots: x = {root1}, x = {root2}")
 
 # Symbolic solution with sympy for verification
-quad_eq = a*x**2 + b*x + c
-solutions = sp.solve(quad_eq, x)
+solutions = symbolic_roots([a, b, c])
 print(f"Symbolic solutions: {solutions}")
 
+# Many quadratics at once: each position in the arrays is one equation a*x^2 + b*x + c = 0.
+# solve_quadratics uses a cancellation-free form of the formula, so tiny roots stay accurate
+# even when b^2 is much larger than 4ac (the last equation below).
+a_arr = [1, 1, 2, 1]
+b_arr = [-5, 2, -8, 1e8]
+c_arr = [6, 5, 3, 1]
+high, low, disc = solve_quadratics(a_arr, b_arr, c_arr, return_complex=True)
+for i in range(len(a_arr)):
+    print(f"{a_arr[i]}x^2 + {b_arr[i]:g}x + {c_arr[i]} = 0 -> roots {high[i]:.6g}, {low[i]:.6g}")
+
 # Step 8: Real-World Application (P&C Insurance Context)
 # Example: Model claim cost growth as a quadratic function in P&C insurance
 # Suppose claim costs grow as C(t) = 100t^2 + 200t + 500, where t is time in years
 print("\n--- P&C Insurance Application: Quadratic Cost Model ---")
-t = np.array([0, 1, 2, 3])  # Time points
-claim_costs = 100 * t**2 + 200 * t + 500
+t = [0, 1, 2, 3]  # Time points
+claim_costs = claim_cost(t)
 print(f"Claim costs over time (C(t) = 100t^2 + 200t + 500): {claim_costs.tolist()}")
 
+# The same model defined once as a symbolic expression and compiled to a NumPy function.
+# compile_numpy caches the compiled function, so repeated use costs no sympy work.
+cost_model = compile_numpy("100*t**2 + 200*t + 500", "t")
+print(f"Compiled symbolic model at the same times: {cost_model(t).tolist()}")
+
 # End of Script
 print("\n--- End of Basic Algebra Concepts Explanation ---")
\ No newline at end of file
@@ -0,0 +1,36 @@
+"""
+Algebra foundation examples as an importable package.
+
+Covers the linear/quadratic solvers, batched polynomial helpers, the
+memoized sympy layer (`symbolic`) and the chunked claim-cost projection.
+sympy is imported only by the symbolic helpers, on their first call.
+"""
+from lazy_exports import attach
+
+_EXPORTS = {
+    # algebra.py
+    "add_polynomials": "algebra",
+    "add_polynomials_batch": "algebra",
+    "claim_cost": "algebra",
+    "evaluate_polynomial": "algebra",
+    "factor_polynomial": "algebra",
+    "horner": "algebra",
+    "log_summary": "algebra",
+    "polynomial_roots_batch": "algebra",
+    "product_rule": "algebra",
+    "quadratic_roots": "algebra",
+    "solve_linear": "algebra",
+    "solve_quadratics": "algebra",
+    "symbolic_roots": "algebra",
+    # symbolic.py
+    "SymbolicCache": "symbolic",
+    "compile_numpy": "symbolic",
+    "factor_cached": "symbolic",
+    "solve_cached": "symbolic",
+    # claim_projection.py
+    "ClaimProjection": "claim_projection",
+    "iter_csv_chunks": "claim_projection",
+    "iter_npy_chunks": "claim_projection",
+}
+
+__getattr__, __dir__, __all__ = attach(__name__, _EXPORTS)
@@ -0,0 +1,125 @@
+# Importable versions of the computations walked through in 01_run.py.
+# Only numpy is imported at module load; sympy is imported inside the
+# symbolic helpers on first use, so importing this module stays fast.
+import numpy as np
+
+
+# Basic Algebra: solve a*x + b = c for x
+def solve_linear(a, b, c):
+    return (c - b) / a
+
+
+# Exponents: product rule a^m * a^n = a^(m+n)
+def product_rule(base, m, n):
+    return base ** (m + n)
+
+
+# Logarithms: ln(x), log_10(x) and the product rule log(x*y) = log(x) + log(y)
+def log_summary(x, y):
+    return {
+        "ln_x": np.log(x),
+        "log10_y": np.log10(y),
+        "log10_xy": np.log10(x * y),
+    }
+
+
+# Polynomials: coefficients are ordered from the highest power down (numpy convention)
+def evaluate_polynomial(coeffs, x):
+    return np.polyval(coeffs, x)
+
+
+def add_polynomials(coeffs1, coeffs2):
+    return np.polyadd(coeffs1, coeffs2)
+
+
+# Factoring: symbolic factorization of a polynomial given by its coefficients (sympy)
+def factor_polynomial(coeffs, symbol="x"):
+    import sympy as sp
+
+    x = sp.Symbol(symbol)
+    return sp.factor(sp.Poly(list(coeffs), x).as_expr())
+
+
+def symbolic_roots(coeffs, symbol="x"):
+    import sympy as sp
+
+    x = sp.Symbol(symbol)
+    return sp.solve(sp.Poly(list(coeffs), x).as_expr(), x)
+
+
+# Quadratic Equations: discriminant and roots of a*x^2 + b*x + c = 0 (quadratic formula)
+def quadratic_roots(a, b, c):
+    discriminant = b**2 - 4*a*c
+    root1 = (-b + np.sqrt(discriminant)) / (2*a)
+    root2 = (-b - np.sqrt(discriminant)) / (2*a)
+    return discriminant, root1, root2
+
+
+# Bulk quadratic solver for arrays of coefficients (one equation per element).
+# The textbook formula loses precision when b^2 >> 4ac, because -b + sqrt(b^2 - 4ac)
+# subtracts two nearly equal numbers. Instead compute
+#   q = -(b + sign(b) * sqrt(b^2 - 4ac)) / 2,  x1 = q / a,  x2 = c / q
+# which never cancels. Real roots are returned larger first; equations with a = 0 are
+# treated as linear (second root nan; both nan when a = b = 0, which has no single root).
+# Complex pairs are nan unless return_complex=True.
+def solve_quadratics(a, b, c, return_complex=False):
+    a, b, c = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (a, b, c)))
+    discriminant = b * b - 4 * a * c
+    sqrt_disc = np.sqrt(np.maximum(discriminant, 0))
+    q = -0.5 * (b + np.copysign(sqrt_disc, b))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x1 = q / a
+        x2 = np.where(q == 0, 0.0, c / q)  # q = 0 only when b = c = 0: double root at 0
+        linear = a == 0
+        x1 = np.where(linear, np.where(b != 0, -c / b, np.nan), x1)
+        x2 = np.where(linear, np.nan, x2)
+    root1, root2 = np.fmax(x1, x2), np.fmin(x1, x2)
+    root2 = np.where(linear, np.nan, root2)
+    complex_pair = (discriminant < 0) & ~linear
+    if not return_complex:
+        return np.where(complex_pair, np.nan, root1), np.where(complex_pair, np.nan, root2), discriminant
+    with np.errstate(divide="ignore", invalid="ignore"):
+        real = -b / (2 * a)
+        imag = np.sqrt(np.maximum(-discriminant, 0)) / (2 * np.abs(a))
+    root1 = np.where(complex_pair, real + 1j * imag, root1)
+    root2 = np.where(complex_pair, real - 1j * imag, root2)
+    return root1, root2, discriminant
+
+
+# Batched Horner evaluation: coeffs has shape (..., degree + 1), highest power first.
+# x broadcasts against the leading (...) shape; extra trailing axes on x evaluate each
+# polynomial at several points, e.g. coeffs (n, 3) with x (n, m) -> (n, m).
+def horner(coeffs, x):
+    coeffs = np.asarray(coeffs)
+    x = np.asarray(x)
+    extra = (1,) * max(x.ndim - (coeffs.ndim - 1), 0)
+    result = np.zeros(np.broadcast_shapes(coeffs.shape[:-1] + extra, x.shape),
+                      dtype=np.result_type(coeffs, x, float))
+    for k in range(coeffs.shape[-1]):
+        result *= x
+        result += coeffs[..., k].reshape(coeffs.shape[:-1] + extra)
+    return result
+
+
+# Batched polynomial addition: coefficient arrays (..., n1) and (..., n2), highest power first
+def add_polynomials_batch(coeffs1, coeffs2):
+    coeffs1, coeffs2 = np.asarray(coeffs1), np.asarray(coeffs2)
+    width = max(coeffs1.shape[-1], coeffs2.shape[-1])
+    pad = lambda c: np.pad(c, [(0, 0)] * (c.ndim - 1) + [(width - c.shape[-1], 0)])
+    return pad(coeffs1) + pad(coeffs2)
+
+
+# Roots of many polynomials of the same degree (..., degree + 1) as eigenvalues of their
+# companion matrices, computed as one batched eigenvalue call. Leading coefficients must be nonzero.
+def polynomial_roots_batch(coeffs):
+    coeffs = np.asarray(coeffs, dtype=float)
+    degree = coeffs.shape[-1] - 1
+    companion = np.zeros(coeffs.shape[:-1] + (degree, degree))
+    companion[..., 0, :] = -coeffs[..., 1:] / coeffs[..., :1]
+    companion[..., np.arange(1, degree), np.arange(degree - 1)] = 1
+    return np.linalg.eigvals(companion)
+
+
+# P&C Insurance Application: C(t) = 100t^2 + 200t + 500 by default
+def claim_cost(t, coeffs=(100, 200, 500)):
+    return np.polyval(coeffs, np.asarray(t))
@@ -0,0 +1,129 @@
+# Chunked projection of polynomial claim-cost curves for large policy portfolios.
+# Generalizes the P&C example in 01_run.py, C(t) = 100t^2 + 200t + 500, to one coefficient
+# set per policy, long monthly horizons and per-segment aggregates.
+#
+# The policy x time cost matrix is never built. A cost curve is c_0 t^d + ... + c_d, so
+#   - the total curve of a segment is (sum of its policies' coefficients) @ V, where
+#     V[k, j] = t_j^(d-k) is a small (d+1) x months matrix of powers
+#   - a policy's cost over the whole horizon is its coefficients @ V.sum(axis=1)
+# Each chunk therefore costs O(policies x degree), and only per-segment coefficient
+# sums plus one float32 horizon total per policy (for percentiles) are kept.
+import itertools
+import numpy as np
+
+
+# Chunk readers yielding (coeffs, segments): coeffs (m, degree + 1) highest power first,
+# segments (m,) non-negative integer segment ids.
+# .npy file with columns [c_0, ..., c_d, segment], opened as a memory map
+def iter_npy_chunks(path, chunk_size=1_000_000):
+    data = np.load(path, mmap_mode="r")
+    for start in range(0, len(data), chunk_size):
+        block = np.asarray(data[start:start + chunk_size])
+        yield block[:, :-1], block[:, -1].astype(np.int64)
+
+
+# CSV file with the same column layout, read chunk_size lines at a time
+def iter_csv_chunks(path, chunk_size=1_000_000, delimiter=",", skip_header=1):
+    with open(path) as f:
+        for _ in range(skip_header):
+            next(f, None)
+        while True:
+            lines = list(itertools.islice(f, chunk_size))
+            if not lines:
+                break
+            block = np.loadtxt(lines, delimiter=delimiter, ndmin=2)
+            yield block[:, :-1], block[:, -1].astype(np.int64)
+
+
+class ClaimProjection:
+    # horizon_months: number of monthly steps (t = 0, 1/12, 2/12, ... years)
+    # degree: degree of the per-policy cost polynomial (2 for the quadratic model)
+    # discount_rate: annual rate for the present value of each policy's horizon cost (0 = undiscounted)
+    def __init__(self, horizon_months, degree=2, discount_rate=0.0):
+        self.months = np.arange(horizon_months)
+        t = self.months / 12
+        self.powers = t[None, :] ** np.arange(degree, -1, -1)[:, None]  # V, (degree + 1, months)
+        weights = (1 + discount_rate) ** -t
+        self.horizon_weights = self.powers @ weights  # sum_t w_t t^(d-k), (degree + 1,)
+        self.coeff_sums = np.zeros((0, degree + 1))
+        self.counts = np.zeros(0, dtype=np.int64)
+        self._horizon_costs = []  # per chunk: (segments, float32 horizon cost per policy)
+
+    def _grow(self, n_segments):
+        if n_segments > len(self.counts):
+            extra = n_segments - len(self.counts)
+            self.coeff_sums = np.vstack([self.coeff_sums, np.zeros((extra, self.coeff_sums.shape[1]))])
+            self.counts = np.concatenate([self.counts, np.zeros(extra, dtype=np.int64)])
+
+    def add_chunk(self, coeffs, segments):
+        coeffs = np.asarray(coeffs, dtype=float)
+        segments = np.asarray(segments, dtype=np.int64)
+        self._grow(int(segments.max()) + 1)
+        n = len(self.counts)
+        self.counts += np.bincount(segments, minlength=n)
+        for k in range(coeffs.shape[1]):
+            self.coeff_sums[:, k] += np.bincount(segments, weights=coeffs[:, k], minlength=n)
+        self._horizon_costs.append((segments.astype(np.int32), (coeffs @ self.horizon_weights).astype(np.float32)))
+        return self
+
+    def add_chunks(self, chunks):
+        for coeffs, segments in chunks:
+            self.add_chunk(coeffs, segments)
+        return self
+
+    # Combine with a projection built on another shard (same horizon, degree and discount rate)
+    def merge(self, other):
+        self._grow(len(other.counts))
+        n = len(other.counts)
+        self.coeff_sums[:n] += other.coeff_sums
+        self.counts[:n] += other.counts
+        self._horizon_costs.extend(other._horizon_costs)
+        return self
+
+    # Aggregates:
+    # - segment_curves: (segments, months) total cost per month of each segment
+    # - total_curve: (months,) total cost per month of the portfolio
+    # - horizon_percentiles: (segments, len(percentiles)) percentiles of per-policy horizon cost
+    def result(self, percentiles=(50, 90, 99)):
+        segment_curves = self.coeff_sums @ self.powers
+        segments = np.concatenate([s for s, _ in self._horizon_costs])
+        costs = np.concatenate([c for _, c in self._horizon_costs])
+        order = np.argsort(segments, kind="stable")
+        bounds = np.concatenate([[0], np.cumsum(self.counts)])
+        horizon_percentiles = np.full((len(self.counts), len(percentiles)), np.nan)
+        for seg in np.flatnonzero(self.counts):
+            horizon_percentiles[seg] = np.percentile(costs[order[bounds[seg]:bounds[seg + 1]]], percentiles)
+        return {
+            "months": self.months,
+            "policies": self.counts,
+            "segment_curves": segment_curves,
+            "total_curve": segment_curves.sum(axis=0),
+            "segment_horizon_totals": self.coeff_sums @ self.horizon_weights,
+            "percentiles": tuple(percentiles),
+            "horizon_percentiles": horizon_percentiles,
+        }
+
+
+if __name__ == "__main__":
+    import tempfile
+    from pathlib import Path
+
+    # Synthetic portfolio: 2 million policies in 4 segments, coefficients around the 01_run.py example
+    rng = np.random.default_rng(0)
+    n = 2_000_000
+    portfolio = np.column_stack([
+        rng.gamma(4.0, 25.0, n),    # t^2 coefficient (mean 100)
+        rng.gamma(4.0, 50.0, n),    # t coefficient (mean 200)
+        rng.gamma(5.0, 100.0, n),   # constant (mean 500)
+        rng.integers(0, 4, n),      # segment id
+    ])
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "portfolio.npy"
+        np.save(path, portfolio)
+        projection = ClaimProjection(horizon_months=360).add_chunks(iter_npy_chunks(path, chunk_size=250_000))
+    summary = projection.result()
+
+    print(f"Portfolio cost in month 0: {summary['total_curve'][0]:,.0f}; month 359: {summary['total_curve'][-1]:,.0f}")
+    for seg, (count, pct) in enumerate(zip(summary["policies"], summary["horizon_percentiles"])):
+        print(f"Segment {seg}: {count:,} policies, 30-year cost per policy "
+              f"p50={pct[0]:,.0f} p90={pct[1]:,.0f} p99={pct[2]:,.0f}")
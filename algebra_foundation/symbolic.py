@@ -0,0 +1,219 @@
+# Memoized symbolic layer for the factor/solve/evaluate steps of 01_run.py.
+# sympy is slow compared with NumPy, so each result is computed once per expression:
+# - factor / solve results are cached in memory and on disk (one JSON file per result,
+#   keyed by a hash of the canonical form), so they survive restarts. Results are stored
+#   as a JSON expression tree and rebuilt only from an allowlist of sympy classes, never
+#   with eval/sympify (unevaluated, so a reload returns exactly the computed expression),
+#   and a file is used only if its stored key matches the request.
+#   Keep SYMBOLIC_CACHE_DIR private to your user all the same: whoever can write it
+#   decides what results you get back.
+# - compiled NumPy functions from sympy.lambdify are cached in memory
+# The key is sympy's srepr of the parsed expression, so "x**2 - 5*x + 6" and
+# "6 - 5*x + x**2" share a cache entry; repeat calls with the same string skip parsing.
+# sympy is imported on first use only.
+import hashlib
+import json
+import os
+from pathlib import Path
+import numpy as np
+
+DEFAULT_CACHE_DIR = Path(os.environ.get("SYMBOLIC_CACHE_DIR", Path.home() / ".cache" / "basic_mathematics" / "symbolic"))
+CACHE_FORMAT = 2
+
+# Node types a stored tree may contain: operators, functions, and singleton constants
+_OPERATORS = ("Add", "Mul", "Pow", "exp", "log", "sin", "cos", "tan", "Abs")
+_CONSTANTS = ("ImaginaryUnit", "Pi", "Exp1", "Infinity", "NegativeInfinity", "ComplexInfinity", "NaN")
+
+
+class UnsupportedExpression(ValueError):
+    pass
+
+
+# Expression -> nested lists of plain JSON values, e.g. x + 1 -> ["Add", ["Integer", "1"], ["Symbol", "x"]]
+def _to_tree(expr):
+    import sympy as sp
+
+    if type(expr) is sp.Symbol and expr == sp.Symbol(expr.name):  # no extra assumptions
+        return ["Symbol", expr.name]
+    if expr.is_Integer:
+        return ["Integer", str(expr.p)]
+    if expr.is_Rational:
+        return ["Rational", str(expr.p), str(expr.q)]
+    if expr.is_Float:
+        sign, mantissa, exponent, bits = expr._mpf_  # exact binary value, no decimal rounding
+        return ["Float", sign, hex(mantissa)[2:], exponent, bits, expr._prec]
+    name = type(expr).__name__
+    if name in _CONSTANTS:
+        return [name]
+    if name in _OPERATORS:
+        return [name] + [_to_tree(arg) for arg in expr.args]
+    raise UnsupportedExpression(name)
+
+
+def _from_tree(tree):
+    import sympy as sp
+
+    name, args = tree[0], tree[1:]
+    if name == "Symbol":
+        return sp.Symbol(str(args[0]))
+    if name == "Integer":
+        return sp.Integer(int(args[0]))
+    if name == "Rational":
+        return sp.Rational(int(args[0]), int(args[1]))
+    if name == "Float":
+        sign, mantissa, exponent, bits, prec = args
+        return sp.Float((int(sign), str(mantissa), int(exponent), int(bits)), precision=int(prec))
+    if name in _CONSTANTS:
+        return getattr(sp.S, name)
+    if name in _OPERATORS:
+        # evaluate=False keeps the stored form: Mul(2, x + 1) would otherwise distribute to 2*x + 2
+        return getattr(sp, name)(*(_from_tree(arg) for arg in args), evaluate=False)
+    raise UnsupportedExpression(name)
+
+
+class SymbolicCache:
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, persist=True):
+        self.cache_dir = Path(cache_dir)
+        self.persist = persist
+        self._results = {}
+        self._compiled = {}
+
+    @staticmethod
+    def _parse(expr):
+        import sympy as sp
+
+        return sp.sympify(expr)
+
+    @staticmethod
+    def canonical(expr):
+        import sympy as sp
+
+        return sp.srepr(SymbolicCache._parse(expr))
+
+    def _path(self, key):
+        return self.cache_dir / (hashlib.sha256(key.encode()).hexdigest() + ".json")
+
+    # Stored result for key, or None if missing, from another format/key, or not rebuildable
+    def _load(self, path, key):
+        try:
+            data = json.loads(path.read_text())
+            if data.get("format") != CACHE_FORMAT or data.get("key") != key:
+                return None
+            stored = data["result"]
+            if data["is_list"]:
+                return [_from_tree(tree) for tree in stored]
+            return _from_tree(stored)
+        except (OSError, ValueError, KeyError, IndexError, TypeError, AttributeError):
+            return None
+
+    def _store(self, path, key, result):
+        try:
+            is_list = isinstance(result, list)
+            stored = [_to_tree(r) for r in result] if is_list else _to_tree(result)
+            rebuilt = [_from_tree(t) for t in stored] if is_list else _from_tree(stored)
+        except UnsupportedExpression:
+            return  # e.g. CRootOf results: kept in memory only
+        if rebuilt != result:
+            return  # would not load back as the same expression: kept in memory only
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({"format": CACHE_FORMAT, "key": key, "is_list": is_list, "result": stored}))
+        os.replace(tmp, path)  # atomic, so concurrent processes never see a partial file
+
+    # Look up (operation, expression, args) in memory, then on disk, else compute and store.
+    def _cached(self, operation, expr, args, compute):
+        raw_key = (operation, str(expr), tuple(args))
+        if raw_key in self._results:
+            return self._results[raw_key]
+        key = json.dumps([operation, self.canonical(expr), [str(a) for a in args]])
+        if key in self._results:
+            self._results[raw_key] = self._results[key]
+            return self._results[key]
+        path = self._path(key)
+        result = self._load(path, key) if self.persist and path.exists() else None
+        if result is None:
+            result = compute(self._parse(expr))
+            if self.persist:
+                self._store(path, key, result)
+        self._results[key] = self._results[raw_key] = result
+        return result
+
+    # Factoring, e.g. factor("x**2 - 5*x + 6") -> (x - 3)*(x - 2)
+    def factor(self, expr):
+        import sympy as sp
+
+        return self._cached("factor", expr, [], sp.factor)
+
+    # Solving expr = 0 for symbol, e.g. solve("x**2 - 5*x + 6", "x") -> [2, 3]
+    def solve(self, expr, symbol):
+        import sympy as sp
+
+        return self._cached("solve", expr, [symbol], lambda e: sp.solve(e, sp.Symbol(symbol)))
+
+    # Vectorized NumPy function of the given symbols, e.g.
+    #   cost = compile("100*t**2 + 200*t + 500", "t"); cost(np.arange(10**6))
+    # Constant expressions are broadcast to the shape of the inputs.
+    def compile(self, expr, *symbols):
+        raw_key = (str(expr), symbols)
+        if raw_key in self._compiled:
+            return self._compiled[raw_key]
+        key = (self.canonical(expr), symbols)
+        if key not in self._compiled:
+            import sympy as sp
+
+            fn = sp.lambdify([sp.Symbol(s) for s in symbols], self._parse(expr), modules="numpy")
+
+            def evaluate(*args):
+                args = [np.asarray(a) for a in args]
+                out = fn(*args)
+                shape = np.broadcast_shapes(*(np.shape(a) for a in args))
+                return np.broadcast_to(out, shape) if np.shape(out) != shape else out
+
+            self._compiled[key] = evaluate
+        self._compiled[raw_key] = self._compiled[key]
+        return self._compiled[key]
+
+    # Drop the in-memory caches and (optionally) the files on disk
+    def clear(self, disk=False):
+        self._results.clear()
+        self._compiled.clear()
+        if disk and self.cache_dir.exists():
+            for path in self.cache_dir.glob("*.json"):
+                path.unlink()
+
+
+_default_cache = None
+
+
+def default_cache():
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = SymbolicCache()
+    return _default_cache
+
+
+def factor_cached(expr):
+    return default_cache().factor(expr)
+
+
+def solve_cached(expr, symbol="x"):
+    return default_cache().solve(expr, symbol)
+
+
+def compile_numpy(expr, *symbols):
+    return default_cache().compile(expr, *symbols)
+
+
+if __name__ == "__main__":
+    import time
+
+    start = time.perf_counter()
+    print("factor:", factor_cached("x**2 - 5*x + 6"), "| solve:", solve_cached("6 - 5*x + x**2"))
+    print(f"first call (computed or loaded from disk): {time.perf_counter() - start:.4f} s")
+    start = time.perf_counter()
+    factor_cached("x**2 - 5*x + 6")
+    print(f"repeat call (memory): {time.perf_counter() - start:.6f} s")
+
+    cost = compile_numpy("100*t**2 + 200*t + 500", "t")
+    t = np.arange(0, 10_000_000) / 12  # monthly steps
+    print("C(t) at t = 0, 1/12, 2/12:", cost(t[:3]), "| total over 10M steps:", f"{cost(t).sum():.4g}")
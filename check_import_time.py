@@ -0,0 +1,63 @@
+"""
+check_import_time.py
+--------------------
+Import-time budget check for the example packages.
+
+Each package is imported in a fresh interpreter, one of its functions is
+accessed (which loads the submodule and NumPy), and the wall time is
+compared with a budget. It also fails if sympy, scipy or matplotlib got
+imported along the way: those must only load when a function that needs
+them is called.
+
+Usage:
+  python check_import_time.py                # default budget 0.5 s
+  python check_import_time.py --budget 0.25
+"""
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+HEAVY = ("sympy", "scipy", "matplotlib")
+
+# package -> one function to touch after import
+PACKAGES = {
+    "algebra_foundation": "quadratic_roots",
+    "probability_for_uncertainty_and_evaluation": "bayes_posterior",
+    "linear_algebra_for_representations": "catch_up",
+}
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {package}
+{package}.{function}
+elapsed = time.perf_counter() - start
+heavy = sorted(m for m in {heavy!r} if m in sys.modules)
+print(json.dumps({{"seconds": elapsed, "heavy": heavy}}))
+"""
+
+def measure(package: str, function: str) -> dict:
+    code = PROBE.format(package=package, function=function, heavy=HEAVY)
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True,
+                         capture_output=True, text=True).stdout
+    return json.loads(out)
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--budget", type=float, default=0.5, help="seconds allowed per package")
+    args = parser.parse_args(argv)
+
+    failed = False
+    for package, function in PACKAGES.items():
+        result = measure(package, function)
+        ok = result["seconds"] <= args.budget and not result["heavy"]
+        failed |= not ok
+        heavy = f" (loaded {', '.join(result['heavy'])})" if result["heavy"] else ""
+        print(f"{'OK  ' if ok else 'FAIL'} {package:<45} {result['seconds'] * 1e3:7.1f} ms{heavy}")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
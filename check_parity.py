@@ -0,0 +1,112 @@
+"""
+check_parity.py
+---------------
+Numerical parity checks for the in-house estimators in Matrix/.
+
+Each check fits one of our estimators and its reference implementation
+(scikit-learn or NumPy) on the same data and compares the results: every
+reported difference must be within its tolerance. scikit-learn is needed,
+as it is for the scripts being checked.
+
+Usage:
+  python check_parity.py             # run every check
+  python check_parity.py pca         # run only the named checks
+"""
+import argparse
+import sys
+from pathlib import Path
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent
+ML_DIR = ROOT / "Matrix" / "matrix-based-ml-techqniues"
+sys.path[:0] = [str(ML_DIR), str(ROOT / "Matrix" / "matrix_operations")]
+
+def max_abs_diff(a, b) -> float:
+    return float(np.max(np.abs(np.asarray(a) - np.asarray(b))))
+
+def check_pca() -> dict:
+    """StreamingPCA on 500-row chunks vs StandardScaler + PCA on winequality-red, both solvers."""
+    from sklearn.decomposition import PCA
+    from sklearn.preprocessing import StandardScaler
+    from streaming_pca import StreamingPCA
+
+    X = np.loadtxt(ML_DIR / "winequality-red.csv", delimiter=";", skiprows=1)[:, :-1]
+    reference = PCA(n_components=3).fit(StandardScaler().fit_transform(X))
+    results = {}
+    for solver in ("incremental", "randomized"):
+        pca = StreamingPCA(n_components=3, solver=solver, chunk_size=500).fit(X)
+        # components are defined up to sign
+        results[f"{solver} |components|"] = (max_abs_diff(np.abs(pca.components_), np.abs(reference.components_)), 1e-10)
+        results[f"{solver} explained variance ratio"] = (
+            max_abs_diff(pca.explained_variance_ratio_, reference.explained_variance_ratio_), 1e-10)
+    return results
+
+def check_svm() -> dict:
+    """LinearSVM (dual coordinate descent) vs LinearSVC(loss="hinge") on standardized breast_cancer."""
+    from sklearn.datasets import load_breast_cancer
+    from sklearn.preprocessing import StandardScaler
+    from sklearn.svm import LinearSVC
+    from linear_svm import LinearSVM
+
+    data = load_breast_cancer()
+    ours = LinearSVM(C=1.0, tol=1e-4, max_iter=100_000).fit(data.data, data.target)
+    X = StandardScaler().fit_transform(data.data)
+    reference = LinearSVC(C=1.0, loss="hinge", tol=1e-5, max_iter=1_000_000).fit(X, data.target)
+    return {
+        "coef": (max_abs_diff(ours.coef_, reference.coef_[0]), 1e-3),
+        "intercept": (abs(ours.intercept_ - reference.intercept_[0]), 1e-3),
+        "mismatched predictions": (int(np.sum(ours.predict(data.data) != reference.predict(X))), 0),
+    }
+
+def check_covariance() -> dict:
+    """StreamingCovariance (small blocks, merged shards, memmap workers) vs np.cov / np.corrcoef."""
+    import os
+    import tempfile
+    from streaming_covariance import StreamingCovariance, memmap_shards, parallel_covariance
+
+    rng = np.random.default_rng(0)
+    X = (1e3 + rng.standard_normal((20_000, 8)) @ rng.standard_normal((8, 8))).astype(np.float32)
+    cov, corr = np.cov(X, rowvar=False, dtype=np.float64), np.corrcoef(X, rowvar=False, dtype=np.float64)
+
+    streamed = StreamingCovariance(block_rows=300).update_chunks(np.array_split(X, 7))
+    merged = StreamingCovariance(block_rows=300)
+    for shard in np.array_split(X, 5):
+        merged.merge(StreamingCovariance(block_rows=300).update(shard))
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "features.npy")
+        np.save(path, X)
+        workers = parallel_covariance(memmap_shards(path, 4), n_workers=2, chunk_rows=2_000, block_rows=300)
+    scale = np.abs(cov).max()
+    return {
+        "streamed covariance (relative)": (max_abs_diff(streamed.covariance(), cov) / scale, 1e-12),
+        "merged shards covariance (relative)": (max_abs_diff(merged.covariance(), cov) / scale, 1e-12),
+        "memmap workers covariance (relative)": (max_abs_diff(workers.covariance(), cov) / scale, 1e-12),
+        "streamed correlation": (max_abs_diff(streamed.correlation(), corr), 1e-12),
+        "memmap workers correlation": (max_abs_diff(workers.correlation(), corr), 1e-12),
+    }
+
+# check name -> function returning {label: (difference, tolerance)}
+CHECKS = {
+    "pca": check_pca,
+    "svm": check_svm,
+    "cov": check_covariance,
+}
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("checks", nargs="*", help=f"checks to run (default: all of {', '.join(CHECKS)})")
+    args = parser.parse_args(argv)
+    unknown = sorted(set(args.checks) - set(CHECKS))
+    if unknown:
+        parser.error(f"unknown check(s): {', '.join(unknown)}")
+
+    failed = False
+    for name in args.checks or CHECKS:
+        for label, (diff, tol) in CHECKS[name]().items():
+            ok = diff <= tol
+            failed |= not ok
+            print(f"{'OK  ' if ok else 'FAIL'} {name:<6} {label:<45} {diff:9.2e} (tol {tol:.0e})")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,52 @@
+"""
+check_symbolic_cache.py
+-----------------------
+Round-trip check for the on-disk cache of algebra_foundation.symbolic.
+
+Each case is computed once by a SymbolicCache on an empty temporary
+directory, then read back by a second, fresh SymbolicCache on the same
+directory. The check fails if nothing was written to disk or if the
+reloaded result is not the same expression (same srepr) as the computed one.
+
+Usage:
+  python check_symbolic_cache.py
+"""
+import sys
+import tempfile
+
+from algebra_foundation.symbolic import SymbolicCache
+
+# (operation, expression, extra args)
+CASES = [
+    ("factor", "x**2 - 5*x + 6", ()),
+    ("factor", "2*x + 2", ()),
+    ("factor", "0.1*x**2 + 3.3*x - 1", ()),
+    ("factor", "2*x*exp(x) + 2*exp(x)", ()),
+    ("factor", "(x + 1)**2*(x - 3)/4", ()),
+    ("solve", "x**2 - 5*x + 6", ("x",)),
+    ("solve", "x**2 + 1", ("x",)),
+    ("solve", "2*x**2 - 3", ("x",)),
+]
+
+def round_trip(operation: str, expr: str, args) -> tuple:
+    """(computed, reloaded, files written) for one case on an empty cache directory."""
+    with tempfile.TemporaryDirectory() as tmp:
+        computed = getattr(SymbolicCache(tmp), operation)(expr, *args)
+        written = len(list(SymbolicCache(tmp).cache_dir.glob("*.json")))
+        reloaded = getattr(SymbolicCache(tmp), operation)(expr, *args)
+    return computed, reloaded, written
+
+def main() -> int:
+    import sympy as sp
+
+    failed = False
+    for operation, expr, args in CASES:
+        computed, reloaded, written = round_trip(operation, expr, args)
+        ok = written == 1 and sp.srepr(computed) == sp.srepr(reloaded)
+        failed |= not ok
+        detail = "" if ok else f" (reloaded {reloaded}, {written} file(s) written)"
+        print(f"{'OK  ' if ok else 'FAIL'} {operation:<6} {expr:<28} -> {computed}{detail}")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,28 @@
+"""
+lazy_exports.py
+---------------
+Lazy attribute loading (PEP 562) shared by the example packages.
+
+A package lists `name -> submodule` in a dict and calls `attach`; each
+name is imported from its submodule the first time it is accessed and
+then cached on the package, so importing the package itself loads none
+of its submodules.
+"""
+import importlib
+import sys
+
+def attach(package: str, exports: dict):
+    """Return (__getattr__, __dir__, __all__) for the package named `package`."""
+
+    def __getattr__(name):
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(f".{module}", package), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__, sorted(exports)
@@ -0,0 +1,19 @@
+"""
+Chase (linear motion) examples as an importable package.
+
+`catch_up` and `catch_up_piecewise` solve when a pursuer reaches a target
+for whole arrays of speeds and head starts; `plot_chase` draws the
+distance-time picture and is the only entry point that loads matplotlib.
+"""
+from lazy_exports import attach
+
+_EXPORTS = {
+    # chase.py
+    "catch_up": "chase",
+    "catch_up_piecewise": "chase",
+    "distance_curves": "chase",
+    "draw_chase": "chase",
+    "plot_chase": "chase",
+}
+
+__getattr__, __dir__, __all__ = attach(__name__, _EXPORTS)
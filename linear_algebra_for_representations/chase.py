@@ -0,0 +1,116 @@
+# Importable versions of the chase computations used in chase_graph.py and thief_robber_car_chase.py.
+# Only numpy is imported at module load; matplotlib is imported by plot_chase on first use,
+# so the math can be used without paying for the plotting stack.
+import sys
+from pathlib import Path
+import numpy as np
+
+
+# Catch-up point: pursuer_speed * t = target_speed * (t + head_start_time) + head_start_distance
+#   => t = gap / (pursuer_speed - target_speed),  gap = target's lead when the pursuer starts
+# Time is measured from when the pursuer starts; speeds and times must use the same units.
+# All arguments broadcast, so arrays of speeds, head starts (start delays of the pursuer)
+# and head-start distances are solved in one pass. Pairs the pursuer never catches
+# (not faster and still behind) get inf; a pursuer that is not behind catches at t = 0.
+# A negative head_start_time means the target starts later and waits at the start point.
+def catch_up(pursuer_speed, target_speed, head_start_time=0.0, head_start_distance=0.0):
+    pursuer_speed, target_speed = np.asarray(pursuer_speed, dtype=float), np.asarray(target_speed, dtype=float)
+    gap = target_speed * np.maximum(head_start_time, 0) + np.asarray(head_start_distance, dtype=float)
+    closing_speed = pursuer_speed - target_speed
+    with np.errstate(divide="ignore", invalid="ignore"):
+        catch_time = np.where(gap <= 0, 0.0, np.where(closing_speed > 0, gap / closing_speed, np.inf))
+        catch_distance = np.where(np.isinf(catch_time), np.inf, pursuer_speed * catch_time)
+    if catch_time.ndim == 0:
+        return float(catch_time), float(catch_distance)
+    return catch_time, catch_distance
+
+
+# Catch-up with piecewise-constant speeds. Segment k runs from segment_starts[k] to
+# segment_starts[k + 1] (the last segment never ends); segment_starts[0] must be 0, the
+# moment the pursuer starts. Speeds have shape (..., K), one row per pursuer/target pair,
+# and head_start_distance (...) is the target's lead at t = 0. A start delay is a leading
+# segment with speed 0 (e.g. a pursuer that leaves 5 minutes after the target). Within
+# each segment the gap changes linearly, so the first segment where it reaches 0 gives
+# the catch time exactly. Returns (catch_time, catch_distance) with inf where the
+# pursuer never catches up.
+def catch_up_piecewise(segment_starts, pursuer_speeds, target_speeds, head_start_distance=0.0):
+    starts = np.asarray(segment_starts, dtype=float)
+    pursuer_speeds, target_speeds = np.broadcast_arrays(np.asarray(pursuer_speeds, dtype=float),
+                                                        np.asarray(target_speeds, dtype=float))
+    durations = np.diff(starts)
+    # Gap (target ahead by) and pursuer position at the start of each segment
+    closing = pursuer_speeds - target_speeds
+    gap_start = np.asarray(head_start_distance, dtype=float)[..., None] - np.concatenate(
+        [np.zeros(closing.shape[:-1] + (1,)), np.cumsum(closing[..., :-1] * durations, axis=-1)], axis=-1)
+    pos_start = np.concatenate(
+        [np.zeros(closing.shape[:-1] + (1,)), np.cumsum(pursuer_speeds[..., :-1] * durations, axis=-1)], axis=-1)
+    with np.errstate(invalid="ignore"):  # 0 * inf in the open-ended last segment
+        gap_end = np.where(closing == 0, gap_start, gap_start - closing * np.append(durations, np.inf))
+    # Level at a segment start only counts if the target is not pulling away (so a pursuer
+    # waiting at the start line is not "caught up" at t = 0)
+    with np.errstate(invalid="ignore"):
+        caught = (gap_start < 0) | ((gap_start == 0) & (closing >= 0)) | ((gap_start > 0) & (gap_end <= 0))
+    segment = np.argmax(caught, axis=-1)
+    never = ~caught.any(axis=-1)
+    take = lambda a: np.take_along_axis(a, segment[..., None], axis=-1)[..., 0]
+    g, c, v, p0 = take(gap_start), take(closing), take(pursuer_speeds), take(pos_start)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        offset = np.where(g <= 0, 0.0, g / c)
+        catch_time = np.where(never, np.inf, starts[segment] + offset)
+        catch_distance = np.where(never, np.inf, p0 + v * offset)  # 0 * inf where never
+    return catch_time, catch_distance
+
+
+# Distance travelled by each vehicle at the given times (since the pursuer started)
+def distance_curves(pursuer_speed, target_speed, head_start_time, time):
+    time = np.asarray(time)
+    target_distance = target_speed * (time + head_start_time)
+    pursuer_distance = pursuer_speed * time
+    return target_distance, pursuer_distance
+
+
+# Distance-time graph with dotted lines and a marker at the catch-up point, drawn on a matplotlib Axes
+def draw_chase(ax, time, target_distance, pursuer_distance, catch_time, catch_distance,
+               target_label, pursuer_label, title, annotation, catch_label=None):
+    ax.plot(time, target_distance, label=target_label, color='blue')
+    ax.plot(time, pursuer_distance, label=pursuer_label, color='green')
+    ax.axvline(x=catch_time, linestyle='--', color='gray', label=catch_label)
+    ax.axhline(y=catch_distance, linestyle='--', color='gray')
+
+    ax.scatter(catch_time, catch_distance, color='red', zorder=5)
+    ax.text(catch_time + 1, catch_distance + 2, annotation, color='black')
+
+    ax.set_xlabel('Time (minutes)')
+    ax.set_ylabel('Distance (km)')
+    ax.set_title(title)
+    ax.legend()
+    ax.grid(True)
+
+
+# Render the chase graph headlessly to <output_dir>/<name> (see plot_rendering.py at the repo root;
+# output_dir defaults to $PLOT_OUTPUT_DIR or ./figures). matplotlib is imported only here.
+def plot_chase(name, output_dir=None, **chase_kwargs):
+    try:
+        from plot_rendering import FigureJob, render_figure
+    except ImportError:
+        sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+        from plot_rendering import FigureJob, render_figure
+    return render_figure(FigureJob(name, draw_chase, chase_kwargs), output_dir)
+
+
+if __name__ == "__main__":
+    import time
+
+    # The sheriff/robber example (km/min), then a fleet-sized batch of random pairs
+    print("Sheriff vs robber:", catch_up(180 / 60, 150 / 60, head_start_time=5))
+    rng = np.random.default_rng(0)
+    n = 1_000_000
+    start = time.perf_counter()
+    t, d = catch_up(rng.uniform(1, 3, n), rng.uniform(1, 3, n), head_start_time=rng.uniform(0, 10, n))
+    print(f"{n:,} pairs in {time.perf_counter() - start:.3f} s, {np.isinf(t).mean():.1%} never caught")
+
+    # Piecewise speeds: the sheriff leaves 5 minutes late, then slows in traffic from minute 20 to 30
+    segment_starts = [0, 5, 20, 30]
+    sheriff = [0, 3, 2, 3]
+    robber = [2.5, 2.5, 2.5, 2.5]
+    print("With a delay and traffic:", catch_up_piecewise(segment_starts, sheriff, robber))
@@ -17,8 +17,8 @@ t = 25 minutes
 Distance = 75 km
 
 """
-import matplotlib.pyplot as plt
 import numpy as np
+from chase import catch_up, distance_curves, plot_chase
 
 # Speeds in km/h
 sheriff_speed = 180
@@ -31,34 +31,19 @@ robber_speed_min = robber_speed / 60
 # Robber's head start in km
 head_start = robber_speed_min * 5  # 5 minutes
 
-# Time range in minutes
-time = np.arange(0, 40, 0.5)  # 0 to 40 minutes
-
-# Distance calculations
-robber_distance = robber_speed_min * (time + 5)  # Robber starts 5 min earlier
-sheriff_distance = sheriff_speed_min * time
-
 # Find intersection point
-catch_time = 25  # minutes
-catch_distance = sheriff_speed_min * catch_time
+catch_time, catch_distance = catch_up(sheriff_speed_min, robber_speed_min, 5)
 
-# Plotting
-plt.figure(figsize=(10, 6))
-plt.plot(time, robber_distance, label='Bank Robber (150 km/h)', color='blue')
-plt.plot(time, sheriff_distance, label='Sheriff (180 km/h)', color='green')
-plt.axvline(x=catch_time, linestyle='--', color='gray', label='Catch Point')
-plt.axhline(y=catch_distance, linestyle='--', color='gray')
+# Time range in minutes (0 to 40 minutes for this chase)
+time = np.arange(0, 1.6 * catch_time, 0.5)
 
-# Annotate catch point
-plt.scatter(catch_time, catch_distance, color='red')
-plt.text(catch_time + 1, catch_distance + 2, f'Catch at {catch_time} min, {catch_distance} km', color='black')
+# Distance calculations (robber starts 5 min earlier)
+robber_distance, sheriff_distance = distance_curves(sheriff_speed_min, robber_speed_min, 5, time)
 
-# Labels and legend
-plt.xlabel('Time (minutes)')
-plt.ylabel('Distance (km)')
-plt.title('Sheriff vs Bank Robber: Chase Graph')
-plt.legend()
-plt.grid(True)
-plt.tight_layout()
-plt.show()
-plt.savefig("/workspaces/basic_mathematics/linear_algebra_for_representations/thief_robber_car_chase.png")
+# Plotting (headless; written to $PLOT_OUTPUT_DIR or ./figures)
+path = plot_chase("thief_robber_car_chase.png", time=time, target_distance=robber_distance,
+                  pursuer_distance=sheriff_distance, catch_time=catch_time, catch_distance=catch_distance,
+                  target_label='Bank Robber (150 km/h)', pursuer_label='Sheriff (180 km/h)',
+                  title='Sheriff vs Bank Robber: Chase Graph',
+                  annotation=f'Catch at {catch_time:g} min, {catch_distance:g} km', catch_label='Catch Point')
+print(f"Saved {path}")
@@ -0,0 +1,152 @@
+"""
+plot_rendering.py
+-----------------
+Headless rendering stage for the example figures.
+
+Figures are described as `FigureJob`s (a file name, a drawing function
+`draw(ax, **kwargs)` and its arguments) and rendered with matplotlib's
+non-interactive Agg backend straight to image files, so scripts never
+block on `plt.show()` and never save blank canvases. Jobs can be spread
+over worker processes, and very large series are reduced before drawing:
+line series with min/max decimation (keeps every peak and trough per
+pixel bucket), scatter series with a seeded random subsample.
+
+Output goes to `output_dir`, or $PLOT_OUTPUT_DIR, or ./figures.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, NamedTuple, Optional
+import numpy as np
+
+class FigureJob(NamedTuple):
+    name: str                 # file name, e.g. "chase.png"
+    draw: Callable            # draw(ax, **kwargs); must be importable to run in a worker
+    kwargs: Optional[dict] = None
+    figsize: tuple = (10, 6)
+
+def figure_output_dir(output_dir=None) -> Path:
+    path = Path(output_dir or os.environ.get("PLOT_OUTPUT_DIR", "figures"))
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+def minmax_decimate(x, y, n_buckets: int = 2000):
+    """Reduce a line series (x sorted) to at most ~4 points per bucket: first, min, max, last.
+
+    The drawn line keeps the same envelope as the full series at screen
+    resolution, at a fraction of the points.
+    """
+    x, y = np.asarray(x), np.asarray(y)
+    if len(y) <= 4 * n_buckets:
+        return x, y
+    edges = np.linspace(0, len(y), n_buckets + 1).astype(np.int64)
+    starts, sizes = edges[:-1], np.diff(edges)
+    idx = np.arange(len(y))
+    # Index of the first min and first max within each bucket
+    bucket_min = np.repeat(np.minimum.reduceat(y, starts), sizes)
+    bucket_max = np.repeat(np.maximum.reduceat(y, starts), sizes)
+    i_min = np.minimum.reduceat(np.where(y == bucket_min, idx, len(y)), starts)
+    i_max = np.minimum.reduceat(np.where(y == bucket_max, idx, len(y)), starts)
+    keep = np.unique(np.concatenate([starts, edges[1:] - 1, i_min, i_max]))
+    return x[keep], y[keep]
+
+def subsample_indices(n: int, max_points: int = 50_000, seed: int = 0) -> np.ndarray:
+    """Sorted random subset of range(n) with at most max_points entries (all of them if n is small)."""
+    if n <= max_points:
+        return np.arange(n)
+    return np.sort(np.random.default_rng(seed).choice(n, size=max_points, replace=False))
+
+def draw_scatter(ax, x, y, hue=None, max_points=50_000, title=None, xlabel=None, ylabel=None, cmap="Spectral"):
+    """Scatter plot coloured by `hue` (one colour per distinct value), subsampled to max_points."""
+    keep = subsample_indices(len(x), max_points)
+    x, y = np.asarray(x)[keep], np.asarray(y)[keep]
+    if hue is None:
+        ax.scatter(x, y, s=8, alpha=0.7)
+    else:
+        import matplotlib
+
+        hue = np.asarray(hue)[keep]
+        values = np.unique(hue)
+        colours = matplotlib.colormaps[cmap](np.linspace(0, 1, len(values)))
+        for value, colour in zip(values, colours):
+            mask = hue == value
+            ax.scatter(x[mask], y[mask], s=8, alpha=0.7, color=colour, label=str(value))
+        ax.legend(title="hue", fontsize="small")
+    ax.set_title(title)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+
+def draw_line(ax, x, y, title=None, xlabel=None, ylabel=None):
+    """Thin line plot; pass series through minmax_decimate first when they are long."""
+    ax.plot(x, y, linewidth=0.5)
+    ax.set_title(title)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+
+def draw_counts(ax, labels, title=None):
+    """Bar chart of how often each label occurs (a countplot)."""
+    values, counts = np.unique(np.asarray(labels), return_counts=True)
+    ax.bar([str(v) for v in values], counts, color=["#66c2a5", "#fc8d62", "#8da0cb", "#e78ac3"][:len(values)])
+    ax.set_title(title)
+    ax.set_ylabel("count")
+
+def draw_confusion_matrix(ax, matrix, labels=None, title=None):
+    """Confusion matrix as an annotated heat map (rows = true class, columns = predicted)."""
+    matrix = np.asarray(matrix)
+    ax.imshow(matrix, cmap="viridis")
+    for (i, j), value in np.ndenumerate(matrix):
+        ax.text(j, i, str(value), ha="center", va="center",
+                color="white" if value < matrix.max() / 2 else "black")
+    ticks = np.arange(len(matrix))
+    labels = labels if labels is not None else ticks
+    ax.set_xticks(ticks, labels)
+    ax.set_yticks(ticks, labels)
+    ax.set_xlabel("Predicted label")
+    ax.set_ylabel("True label")
+    ax.set_title(title)
+
+def render_figure(job: FigureJob, output_dir=None, dpi: int = 100) -> Path:
+    """Draw one job on a fresh Agg figure and save it; returns the file path."""
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots(figsize=job.figsize)
+    try:
+        job.draw(ax, **(job.kwargs or {}))
+        fig.tight_layout()
+        path = figure_output_dir(output_dir) / job.name
+        fig.savefig(path, dpi=dpi)
+    finally:
+        plt.close(fig)
+    return path
+
+def render_figures(jobs, output_dir=None, n_workers: int = 1, dpi: int = 100) -> list:
+    """Render jobs, in parallel worker processes when n_workers > 1; returns the file paths.
+
+    Workers use the platform's default start method, so scripts that call
+    this with n_workers > 1 need an `if __name__ == "__main__":` guard, and
+    each job's draw function must be defined at module level.
+    """
+    jobs = list(jobs)
+    output_dir = figure_output_dir(output_dir)
+    if n_workers <= 1 or len(jobs) <= 1:
+        return [render_figure(job, output_dir, dpi) for job in jobs]
+    with ProcessPoolExecutor(min(n_workers, len(jobs))) as pool:
+        return list(pool.map(render_figure, jobs, [output_dir] * len(jobs), [dpi] * len(jobs)))
+
+if __name__ == "__main__":
+    # A 5-million-point noisy signal and scatter, decimated before drawing, rendered in parallel
+    rng = np.random.default_rng(0)
+    t = np.linspace(0, 100, 5_000_000)
+    signal = np.sin(t) + 0.2 * rng.standard_normal(t.size)
+    tx, ty = minmax_decimate(t, signal)
+    print(f"Line series: {t.size:,} points -> {tx.size:,} after min/max decimation")
+
+    jobs = [
+        FigureJob("signal.png", draw_line, {"x": tx, "y": ty, "title": "Decimated signal"}),
+        FigureJob("scatter.png", draw_scatter, {"x": signal[:1_000_000], "y": t[:1_000_000],
+                                                "hue": (t[:1_000_000] > 10).astype(int), "title": "Scatter"}),
+    ]
+    for path in render_figures(jobs, n_workers=2):
+        print("wrote", path)
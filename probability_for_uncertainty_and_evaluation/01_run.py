@@ -5,10 +5,12 @@
 # Run this script to see outputs and explanations in the console.
 
 # Step 1: Import Necessary Libraries
-# We import random for basic randomness, numpy for numerical simulations, and scipy.stats for statistical functions.
-import random
+# The computations live in probability.py so other code can import them without running this walkthrough.
+# probability.py uses numpy for numerical simulations (seedable np.random.default_rng streams),
+# and imports scipy.stats for statistical functions only when first needed.
 import numpy as np
-from scipy import stats
+from probability import (bayes_posterior, bernoulli_process, discrete_moments,
+                         empirical_probability, normal_summary, poisson_summary, union_probability)
 
 # Step 2: Basic Probability Concepts
 # Probability is the measure of the likelihood that an event will occur, quantified between 0 (impossible) and 1 (certain).
@@ -29,9 +31,7 @@ print(f"Event: Getting {event_heads}")
 print(f"Probability of {event_heads}: {p_heads}")
 
 # Simulation: Flip coin 1000 times to estimate empirical probability
-flips = [random.choice(sample_space) for _ in range(1000)]
-heads_count = flips.count('Heads')
-empirical_p_heads = heads_count / 1000
+empirical_p_heads = empirical_probability(sample_space, 'Heads', n_trials=1000)
 print(f"Empirical Probability from 1000 flips: {empirical_p_heads}")
 
 # Step 3: Usage of All Probability Terms
@@ -67,7 +67,7 @@ intersection = set(event_even) & set(event_less_than_4)  # {2}
 union = set(event_even) | set(event_less_than_4)  # {1,2,3,4,6}
 
 p_intersection = len(intersection) / len(dice_space)
-p_union = p_even + (len(event_less_than_4)/len(dice_space)) - p_intersection
+p_union = union_probability(event_even, event_less_than_4, dice_space)
 
 print(f"Intersection (Even and <4): {intersection}, P: {p_intersection}")
 print(f"Union (Even or <4): {union}, P: {p_union}")
@@ -105,9 +105,7 @@ print(f"Conditional P(Second Red | First Black): {p_second_red_given_first_black
 p_d = 0.01
 p_pos_given_d = 0.99
 p_pos_given_no_d = 0.05
-p_no_d = 1 - p_d
-p_pos = (p_pos_given_d * p_d) + (p_pos_given_no_d * p_no_d)  # Total P(Positive)
-p_d_given_pos = (p_pos_given_d * p_d) / p_pos  # Bayes' Theorem
+p_d_given_pos = bayes_posterior(p_d, p_pos_given_d, p_pos_given_no_d)  # Bayes' Theorem
 
 print(f"Bayes' Theorem Example: P(Disease|Positive Test) = {p_d_given_pos:.4f}")
 
@@ -125,8 +123,7 @@ print("\n--- Random Variables: Discrete Example (Dice) ---")
 x_values = np.array(dice_space)
 pmf = np.array([1/6] * 6)  # Uniform PMF
 
-expectation = np.sum(x_values * pmf)
-variance = np.sum((x_values - expectation)**2 * pmf)
+expectation, variance = discrete_moments(x_values, pmf)
 
 print(f"Discrete RV (Die): Values {x_values}, PMF {pmf}")
 print(f"Expectation E[X]: {expectation}")
@@ -136,13 +133,13 @@ print(f"Variance Var[X]: {variance}")
 # Example: Heights ~ Normal(mu=170, sigma=10)
 print("\n--- Random Variables: Continuous Example (Normal Distribution) ---")
 mu, sigma = 170, 10
-normal_rv = stats.norm(mu, sigma)
+normal_rv = normal_summary(mu, sigma, pdf_at=170, cdf_at=180)
 
 print(f"Continuous RV: Normal(mu={mu}, sigma={sigma})")
-print(f"Expectation (Mean): {normal_rv.mean()}")
-print(f"Variance: {normal_rv.var()}")
-print(f"PDF at x=170: {normal_rv.pdf(170)}")  # Density at mean
-print(f"CDF at x=180: {normal_rv.cdf(180)}")  # P(X <= 180)
+print(f"Expectation (Mean): {normal_rv['mean']}")
+print(f"Variance: {normal_rv['var']}")
+print(f"PDF at x=170: {normal_rv['pdf']}")  # Density at mean
+print(f"CDF at x=180: {normal_rv['cdf']}")  # P(X <= 180)
 
 # Step 6: Random Processes
 # Random Process (Stochastic Process): A collection of random variables indexed by time or space.
@@ -157,7 +154,7 @@ print(f"CDF at x=180: {normal_rv.cdf(180)}")  # P(X <= 180)
 print("\n--- Random Processes: Bernoulli Process Example ---")
 p_success = 0.5  # Probability of success (e.g., Heads)
 n_trials = 10
-bernoulli_sequence = np.random.binomial(1, p_success, n_trials)  # 1=success, 0=failure
+bernoulli_sequence = bernoulli_process(p_success, n_trials)  # 1=success, 0=failure
 
 print(f"Bernoulli Process (10 Trials, p={p_success}): {bernoulli_sequence}")
 print(f"Number of Successes: {np.sum(bernoulli_sequence)}")
@@ -165,12 +162,11 @@ print(f"Number of Successes: {np.sum(bernoulli_sequence)}")
 # Poisson Process: Simulate events in time interval
 # Poisson RV for count in fixed interval
 lambda_rate = 3  # Average 3 events per interval
-poisson_rv = stats.poisson(lambda_rate)
-poisson_sample = poisson_rv.rvs(5)  # 5 simulations
+poisson_rv = poisson_summary(lambda_rate, n_samples=5, k=2)  # 5 simulations
 
-print(f"Poisson Process (lambda={lambda_rate}): Samples {poisson_sample}")
-print(f"Expectation: {poisson_rv.mean()}")
-print(f"P(Exactly 2 events): {poisson_rv.pmf(2)}")
+print(f"Poisson Process (lambda={lambda_rate}): Samples {poisson_rv['samples']}")
+print(f"Expectation: {poisson_rv['mean']}")
+print(f"P(Exactly 2 events): {poisson_rv['pmf']}")
 
 # End of Script
 print("\n--- End of Probability Concepts Explanation ---")
\ No newline at end of file
@@ -1,11 +1,10 @@
 # Python Script: Annuity Terms Section for Annuity Insurance
 # This is a focused version of the annuity terms section to fix the np.pv error.
 # It calculates present values for ordinary annuity, annuity due, perpetuity, and monthly compounded annuity.
-# Ensure numpy-financial is installed: pip install numpy-financial
+# The formulas live in annuity.py so other code can import them without running this script.
 
 # Step 1: Import Necessary Libraries
-import numpy as np
-import numpy_financial as npf  # Correct import for financial functions
+from annuity import AnnuityPricer, pv_annuity_due, pv_monthly_annuity, pv_ordinary_annuity, pv_perpetuity
 
 # Step 2: Annuity Terms - Present Value Example
 print("\n--- Annuity Terms: Present Value Example ---")
@@ -14,25 +13,32 @@ r = 0.05   # Annual interest rate (5%)
 n = 10     # Number of years
 
 # Present Value (PV) of ordinary annuity: PV = PMT * [1 - (1 + r)^(-n)] / r
-pv_ordinary = pmt * (1 - (1 + r)**(-n)) / r
+pv_ordinary = pv_ordinary_annuity(pmt, r, n)
 print(f"Ordinary Annuity PV: ${pv_ordinary:.2f}")
 
 # Annuity Due PV: Ordinary PV multiplied by (1 + r), since payments start earlier
-pv_due = pv_ordinary * (1 + r)
+pv_due = pv_annuity_due(pmt, r, n)
 print(f"Annuity Due PV: ${pv_due:.2f}")
 
 # Perpetuity PV: PV = PMT / r (infinite periods)
-pv_perpetuity = pmt / r
-print(f"Perpetuity PV: ${pv_perpetuity:.2f}")
+pv_perp = pv_perpetuity(pmt, r)
+print(f"Perpetuity PV: ${pv_perp:.2f}")
 
 # Monthly Compounded Annuity: Adjust for monthly payments
-monthly_r = r / 12
-monthly_n = n * 12
-monthly_pmt = pmt / 12
-
-# Present value with monthly compounding using numpy-financial
-pv_monthly = npf.pv(rate=monthly_r, nper=monthly_n, pmt=-monthly_pmt, fv=0)  # npf.pv returns negative, we use absolute
-print(f"Monthly Compounded Ordinary Annuity PV: ${abs(pv_monthly):.2f}")
+# (rate r/12, n*12 periods, payment pmt/12 — the same closed form npf.pv evaluates)
+pv_monthly = pv_monthly_annuity(pmt, r, n)
+print(f"Monthly Compounded Ordinary Annuity PV: ${pv_monthly:.2f}")
+
+# Pricing Grid: many contracts at once (rates x terms x payment frequencies)
+# AnnuityPricer keeps discount-factor tables per rate, so repeated grids reuse them.
+pricer = AnnuityPricer()
+rates = [0.0, 0.03, 0.05]
+years = [5, 10]
+frequencies = [1, 12]
+grid = pricer.pv_grid(pmt, rates, years, frequencies)
+print("\nPV grid (rows: rate, columns: years x [annual, monthly]):")
+for rate, row in zip(rates, grid):
+    print(f"  r={rate:.2f}: " + "  ".join(f"${v:9.2f}" for v in row.ravel()))
 
 # End of Section
 print("\n--- End of Annuity Terms Section ---")
\ No newline at end of file
@@ -1,6 +1,9 @@
 # Python Script: Conditional Probability of Car Ownership Given Woman
 # Calculates P(Car | Woman) given P(Woman and Car) = 0.20
 
+import numpy as np
+from probability import conditional_probability
+
 # Step 1: Define given probability
 p_woman_and_car = 0.20  # Joint probability P(Woman ∩ Car)
 
@@ -8,7 +11,7 @@ p_woman_and_car = 0.20  # Joint probability P(Woman ∩ Car)
 p_woman = 0.5  # Assumption: 50% of adults are women
 
 # Step 3: Calculate conditional probability P(Car | Woman)
-p_car_given_woman = p_woman_and_car / p_woman
+p_car_given_woman = conditional_probability(p_woman_and_car, p_woman)
 
 # Step 4: Print result
 print(f"P(Woman and Car): {p_woman_and_car * 100}%")
@@ -17,6 +20,11 @@ print(f"P(Car | Woman): {p_car_given_woman * 100:.1f}%")
 
 # Optional: Test with different P(Woman) values
 p_woman_alt = 0.4
-p_car_given_woman_alt = p_woman_and_car / p_woman_alt
+p_car_given_woman_alt = conditional_probability(p_woman_and_car, p_woman_alt)
 print(f"\nIf P(Woman) = {p_woman_alt * 100}%:")
-print(f"P(Car | Woman): {p_car_given_woman_alt * 100:.1f}%")
\ No newline at end of file
+print(f"P(Car | Woman): {p_car_given_woman_alt * 100:.1f}%")
+
+# Optional: the same division for a whole range of P(Woman) values at once
+p_woman_range = np.array([0.3, 0.4, 0.5, 0.6])
+for p_w, p_c in zip(p_woman_range, conditional_probability(p_woman_and_car, p_woman_range)):
+    print(f"P(Woman) = {p_w * 100:.0f}% -> P(Car | Woman) = {p_c * 100:.1f}%")
\ No newline at end of file
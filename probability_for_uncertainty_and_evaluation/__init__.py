@@ -0,0 +1,48 @@
+"""
+Probability and annuity examples as an importable package.
+
+Includes the probability helpers, the batched Monte Carlo engine and the
+deterministic and stochastic-rate annuity pricers. scipy.stats is loaded
+only by the distribution summaries that use it.
+"""
+from lazy_exports import attach
+
+_EXPORTS = {
+    # probability.py
+    "bayes_grid": "probability",
+    "bayes_posterior": "probability",
+    "bernoulli_process": "probability",
+    "conditional_probability": "probability",
+    "contingency_probabilities": "probability",
+    "discrete_moments": "probability",
+    "empirical_probability": "probability",
+    "normal_summary": "probability",
+    "poisson_summary": "probability",
+    "union_probability": "probability",
+    # monte_carlo.py
+    "RunningEstimate": "monte_carlo",
+    "bernoulli_trials": "monte_carlo",
+    "coin_flips": "monte_carlo",
+    "dice_rolls_in": "monte_carlo",
+    "estimate": "monte_carlo",
+    "poisson_counts": "monte_carlo",
+    "simulate": "monte_carlo",
+    # annuity.py
+    "AnnuityPricer": "annuity",
+    "accumulation_factor": "annuity",
+    "annuity_factor": "annuity",
+    "fv_annuity_due": "annuity",
+    "fv_ordinary_annuity": "annuity",
+    "pv_annuity_due": "annuity",
+    "pv_monthly_annuity": "annuity",
+    "pv_ordinary_annuity": "annuity",
+    "pv_perpetuity": "annuity",
+    # stochastic_annuity.py
+    "annuity_pv_from_rates": "stochastic_annuity",
+    "lognormal_paths": "stochastic_annuity",
+    "simulate_annuity_pv": "stochastic_annuity",
+    "summarize_pv": "stochastic_annuity",
+    "vasicek_paths": "stochastic_annuity",
+}
+
+__getattr__, __dir__, __all__ = attach(__name__, _EXPORTS)
@@ -0,0 +1,126 @@
+# Importable versions of the present-value formulas used in 02_run.py, plus a vectorized pricer.
+# Only numpy is needed; the monthly annuity uses the closed form that npf.pv evaluates.
+# All functions broadcast over arrays of payments, rates and terms.
+from collections import OrderedDict
+import numpy as np
+
+
+# Annuity factor a(r, n) = [1 - (1 + r)^(-n)] / r, the PV of 1 paid at the end of each of n periods.
+# Written as -expm1(-n * log1p(r)) / r so it stays exact near r = 0 (where the textbook
+# formula cancels catastrophically); r = 0 gives exactly n.
+def annuity_factor(r, n):
+    r, n = np.broadcast_arrays(np.asarray(r, dtype=float), np.asarray(n, dtype=float))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        factor = -np.expm1(-n * np.log1p(r)) / r
+    return np.where(r == 0, n, factor)
+
+
+# Accumulation factor s(r, n) = [(1 + r)^n - 1] / r, the FV of 1 paid at the end of each period
+def accumulation_factor(r, n):
+    r, n = np.broadcast_arrays(np.asarray(r, dtype=float), np.asarray(n, dtype=float))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        factor = np.expm1(n * np.log1p(r)) / r
+    return np.where(r == 0, n, factor)
+
+
+# Ordinary Annuity: PV = PMT * [1 - (1 + r)^(-n)] / r
+def pv_ordinary_annuity(pmt, r, n):
+    return pmt * annuity_factor(r, n)
+
+
+# Annuity Due: payments start one period earlier, so PV_due = PV_ordinary * (1 + r)
+def pv_annuity_due(pmt, r, n):
+    return pv_ordinary_annuity(pmt, r, n) * (1 + np.asarray(r))
+
+
+# Future Value of an ordinary annuity / annuity due: FV = PMT * [(1 + r)^n - 1] / r (* (1 + r) if due)
+def fv_ordinary_annuity(pmt, r, n):
+    return pmt * accumulation_factor(r, n)
+
+
+def fv_annuity_due(pmt, r, n):
+    return fv_ordinary_annuity(pmt, r, n) * (1 + np.asarray(r))
+
+
+# Perpetuity: PV = PMT / r (infinite periods); a perpetuity due adds the payment made today
+def pv_perpetuity(pmt, r, due=False):
+    with np.errstate(divide="ignore"):
+        pv = np.divide(pmt, r)
+    return pv + pmt if due else pv
+
+
+# Monthly Annuity: annual payment, rate and term converted to monthly periods
+def pv_monthly_annuity(pmt, r, n, periods_per_year=12):
+    return pv_ordinary_annuity(pmt / periods_per_year, r / periods_per_year, n * periods_per_year)
+
+
+# Pricer for whole books of contracts that reuses discount-factor tables across calls.
+# For each periodic rate r the table holds cumulative annuity factors
+#   a[k] = v + v^2 + ... + v^k,  v = 1 / (1 + r),  k = 0..n_max
+# so any integer term is a lookup, and r = 0 is exact (a[k] = k).
+# Tables are kept in an LRU cache: once more than max_tables rates are cached the least
+# recently used table is evicted. hits / misses count table lookups.
+class AnnuityPricer:
+    def __init__(self, max_tables=256):
+        self.max_tables = max_tables
+        self._tables = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _table(self, r, n_max):
+        table = self._tables.get(r)
+        if table is not None and len(table) > n_max:
+            self.hits += 1
+            self._tables.move_to_end(r)
+            return table
+        self.misses += 1
+        discount = (1 + r) ** -np.arange(1, n_max + 1, dtype=float)
+        table = np.concatenate([[0.0], np.cumsum(discount)])
+        self._tables[r] = table
+        self._tables.move_to_end(r)
+        while len(self._tables) > self.max_tables:
+            self._tables.popitem(last=False)
+        return table
+
+    # Annuity factors for broadcast arrays of periodic rates and integer numbers of periods
+    def annuity_factor(self, rate, periods):
+        rate, periods = np.broadcast_arrays(np.asarray(rate, dtype=float), np.asarray(periods))
+        if not np.issubdtype(periods.dtype, np.integer):
+            if np.any(periods != np.round(periods)):
+                raise ValueError("periods must be whole numbers")
+            periods = periods.astype(np.int64)
+        if np.any(periods < 0):
+            raise ValueError("periods must be non-negative")
+        if rate.size == 0:
+            return np.empty(rate.shape)
+        # Group equal rates with one sort, then look each group up in its table
+        flat_rate, flat_periods = rate.ravel(), periods.ravel()
+        order = np.argsort(flat_rate, kind="stable")
+        sorted_rate = flat_rate[order]
+        starts = np.flatnonzero(np.r_[True, sorted_rate[1:] != sorted_rate[:-1]])
+        ends = np.r_[starts[1:], len(order)]
+        out = np.empty(flat_rate.shape)
+        for start, end in zip(starts, ends):
+            rows = order[start:end]
+            n = flat_periods[rows]
+            out[rows] = self._table(float(sorted_rate[start]), int(n.max()))[n]
+        return out.reshape(rate.shape)
+
+    # PV / FV of level payments; rate is per period. due=True prices an annuity due.
+    def pv(self, pmt, rate, periods, due=False):
+        pv = pmt * self.annuity_factor(rate, periods)
+        return pv * (1 + np.asarray(rate)) if due else pv
+
+    def fv(self, pmt, rate, periods, due=False):
+        growth = (1 + np.asarray(rate, dtype=float)) ** np.asarray(periods)
+        return self.pv(pmt, rate, periods, due=due) * growth
+
+    def perpetuity(self, pmt, rate, due=False):
+        return pv_perpetuity(pmt, rate, due=due)
+
+    # PV over a full annual-rate x years x payments-per-year grid for an annual payment pmt.
+    # Returns an array of shape (len(annual_rates), len(years), len(frequencies)).
+    def pv_grid(self, pmt, annual_rates, years, frequencies, due=False):
+        annual, yrs, freq = np.meshgrid(np.asarray(annual_rates, dtype=float), np.asarray(years),
+                                        np.asarray(frequencies), indexing="ij", sparse=True)
+        return self.pv(pmt / freq, annual / freq, yrs * freq, due=due)
@@ -0,0 +1,145 @@
+# Monte Carlo engine for the probability experiments in 01_run.py.
+# Draws are generated in large NumPy batches instead of one Python call per trial.
+# Every batch gets its own child of one SeedSequence, so results are reproducible and
+# identical whether the batches run in this process or on a pool of worker processes.
+# Running estimates (mean and confidence interval) are yielded after each batch, so a
+# caller can stop as soon as the interval is narrow enough.
+import math
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from statistics import NormalDist
+import numpy as np
+
+
+# Samplers: sampler(rng, size) -> array of per-trial values.
+# Indicators (True/False) estimate a probability; counts estimate an expectation.
+# Bind parameters with functools.partial so the sampler can be sent to worker processes.
+def bernoulli_trials(rng, size, p=0.5):
+    return rng.random(size) < p
+
+
+coin_flips = bernoulli_trials  # heads with probability p
+
+
+def dice_rolls_in(rng, size, event=(2, 4, 6), sides=6):
+    return np.isin(rng.integers(1, sides + 1, size), event)
+
+
+def poisson_counts(rng, size, lam=3.0):
+    return rng.poisson(lam, size)
+
+
+# Running estimate of E[X] from the count, mean and M2 (sum of squared deviations) of
+# all draws so far. Two estimates from separate workers or runs combine with merge(),
+# using Chan's pairwise update, which stays accurate when the mean is large relative
+# to the spread (sum-of-squares formulas cancel catastrophically there).
+class RunningEstimate:
+    def __init__(self, n=0, mean=0.0, m2=0.0):
+        self.n, self.mean, self.m2 = n, mean, m2
+
+    def update(self, values):
+        values = np.asarray(values, dtype=float).ravel()
+        if values.size == 0:
+            return self
+        mean = values.mean()
+        self.merge(RunningEstimate(values.size, mean, np.sum((values - mean) ** 2)))
+        return self
+
+    def merge(self, other):
+        n = self.n + other.n
+        if other.n == 0:
+            return self
+        delta = other.mean - self.mean
+        self.mean += delta * other.n / n
+        self.m2 += other.m2 + delta**2 * self.n * other.n / n
+        self.n = n
+        return self
+
+    @property
+    def variance(self):
+        if self.n < 2:
+            return math.inf
+        return self.m2 / (self.n - 1)
+
+    # Normal-approximation interval: mean ± z * sqrt(var / n)
+    def confidence_interval(self, confidence=0.95):
+        z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        half_width = z * math.sqrt(self.variance / self.n)
+        return self.mean - half_width, self.mean + half_width
+
+    def copy(self):
+        return RunningEstimate(self.n, self.mean, self.m2)
+
+    def __repr__(self):
+        low, high = self.confidence_interval()
+        return f"RunningEstimate(n={self.n}, mean={self.mean:.6g}, 95% CI=[{low:.6g}, {high:.6g}])"
+
+
+def _run_batch(sampler, seed_seq, size):
+    values = sampler(np.random.default_rng(seed_seq), size)
+    return RunningEstimate().update(values)
+
+
+# Generator of running estimates (snapshots), one per completed batch (in batch order).
+# - n_trials: total number of draws, split into batches of batch_size
+# - n_workers: >1 runs batches on a process pool (sampler must be picklable)
+# - tol: stop early once the confidence-interval half-width is <= tol
+def simulate(sampler, n_trials, batch_size=1_000_000, seed=None, n_workers=1, confidence=0.95, tol=None):
+    sizes = [batch_size] * (n_trials // batch_size)
+    if n_trials % batch_size:
+        sizes.append(n_trials % batch_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    running = RunningEstimate()
+
+    def converged():
+        low, high = running.confidence_interval(confidence)
+        return tol is not None and (high - low) / 2 <= tol
+
+    if n_workers <= 1:
+        for seed_seq, size in zip(seeds, sizes):
+            running.merge(_run_batch(sampler, seed_seq, size))
+            yield running.copy()
+            if converged():
+                return
+        return
+
+    # Keep a bounded window of batches in flight and consume them in submission order,
+    # so memory stays flat and the sequence of estimates does not depend on scheduling.
+    with ProcessPoolExecutor(n_workers) as pool:
+        pending = []
+        jobs = iter(zip(seeds, sizes))
+        try:
+            for seed_seq, size in jobs:
+                pending.append(pool.submit(_run_batch, sampler, seed_seq, size))
+                if len(pending) < 2 * n_workers:
+                    continue
+                running.merge(pending.pop(0).result())
+                yield running.copy()
+                if converged():
+                    return
+            for future in pending:
+                running.merge(future.result())
+                yield running.copy()
+                if converged():
+                    return
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+# Final estimate after all batches (or after early stopping)
+def estimate(sampler, n_trials, **kwargs):
+    result = None
+    for result in simulate(sampler, n_trials, **kwargs):
+        pass
+    return result
+
+
+if __name__ == "__main__":
+    # P(Heads) for a fair coin, stopping once the 95% CI half-width is below 0.0001
+    for running in simulate(coin_flips, 10**9, batch_size=10**7, seed=42, n_workers=4, tol=1e-4):
+        print(running)
+
+    # E[X] for Poisson(3) counts and P(even) for a die, 10 million draws each
+    print(estimate(partial(poisson_counts, lam=3.0), 10**7, seed=1))
+    print(estimate(dice_rolls_in, 10**7, seed=2))
@@ -0,0 +1,100 @@
+# Importable versions of the computations walked through in 01_run.py and 03_car_owner.py.
+# Only numpy is imported at module load; scipy.stats is imported inside the
+# distribution helpers on first use, so importing this module stays fast.
+# Random helpers take a seed (int, SeedSequence or Generator; None draws fresh entropy)
+# and sample from their own np.random.default_rng stream, never the global state.
+import numpy as np
+
+
+# Basic Probability: relative frequency of an outcome over n equally likely draws
+# (drawn as one NumPy batch of indices; see monte_carlo.py for very large trial counts)
+def empirical_probability(sample_space, event, n_trials=1000, seed=None):
+    draws = np.random.default_rng(seed).integers(len(sample_space), size=n_trials)
+    return np.count_nonzero(draws == sample_space.index(event)) / n_trials
+
+
+# Union of events: P(A ∪ B) = P(A) + P(B) - P(A ∩ B), over a finite equally likely sample space
+def union_probability(event_a, event_b, sample_space):
+    n = len(sample_space)
+    p_intersection = len(set(event_a) & set(event_b)) / n
+    return len(event_a) / n + len(event_b) / n - p_intersection
+
+
+# Conditional Probability: P(A|B) = P(A ∩ B) / P(B)
+# Scalars or arrays (broadcast elementwise); P(B) = 0 gives nan.
+def conditional_probability(p_joint, p_given):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.divide(p_joint, p_given)
+
+
+# Bayes' Theorem: P(A|B) = P(B|A) * P(A) / P(B), with P(B) from the law of total probability
+# Scalars or arrays (broadcast elementwise)
+def bayes_posterior(prior, p_evidence_given_a, p_evidence_given_not_a):
+    prior = np.asarray(prior, dtype=float)
+    p_evidence = p_evidence_given_a * prior + p_evidence_given_not_a * (1 - prior)
+    return conditional_probability(p_evidence_given_a * prior, p_evidence)
+
+
+# Diagnostic test over a full grid of priors x sensitivities x false-positive rates.
+# Each input is 1-D; results have shape (len(priors), len(sensitivities), len(false_positive_rates)).
+# - p_positive:          P(+) = sens * prior + fpr * (1 - prior)
+# - p_condition_given_pos: P(C|+) (positive predictive value)
+# - p_condition_given_neg: P(C|-) = (1 - sens) * prior / (1 - P(+))
+def bayes_grid(priors, sensitivities, false_positive_rates):
+    prior, sens, fpr = np.meshgrid(np.asarray(priors, dtype=float), np.asarray(sensitivities, dtype=float),
+                                   np.asarray(false_positive_rates, dtype=float), indexing="ij", sparse=True)
+    p_positive = sens * prior + fpr * (1 - prior)
+    return {
+        "p_positive": p_positive,
+        "p_condition_given_pos": conditional_probability(sens * prior, p_positive),
+        "p_condition_given_neg": conditional_probability((1 - sens) * prior, 1 - p_positive),
+    }
+
+
+# Contingency table: counts or joint probabilities with rows = A categories, columns = B categories.
+# Accepts one table (R, C) or a stack of tables (..., R, C), e.g. one per segment.
+# - joint:          P(A = i ∩ B = j)
+# - row_marginal:   P(A = i), col_marginal: P(B = j)
+# - col_given_row:  P(B = j | A = i)   (each row sums to 1)
+# - row_given_col:  P(A = i | B = j)   (each column sums to 1)
+def contingency_probabilities(table):
+    table = np.asarray(table, dtype=float)
+    joint = table / table.sum(axis=(-2, -1), keepdims=True)
+    row_marginal = joint.sum(axis=-1)
+    col_marginal = joint.sum(axis=-2)
+    return {
+        "joint": joint,
+        "row_marginal": row_marginal,
+        "col_marginal": col_marginal,
+        "col_given_row": conditional_probability(joint, row_marginal[..., :, None]),
+        "row_given_col": conditional_probability(joint, col_marginal[..., None, :]),
+    }
+
+
+# Discrete Random Variable: E[X] = sum(x * P(x)), Var(X) = E[(X - E[X])^2]
+def discrete_moments(values, pmf):
+    values, pmf = np.asarray(values), np.asarray(pmf)
+    expectation = np.sum(values * pmf)
+    variance = np.sum((values - expectation)**2 * pmf)
+    return expectation, variance
+
+
+# Continuous Random Variable: summary of Normal(mu, sigma) (scipy)
+def normal_summary(mu, sigma, pdf_at, cdf_at):
+    from scipy import stats
+
+    rv = stats.norm(mu, sigma)
+    return {"mean": rv.mean(), "var": rv.var(), "pdf": rv.pdf(pdf_at), "cdf": rv.cdf(cdf_at)}
+
+
+# Bernoulli Process: n independent binary trials with success probability p
+def bernoulli_process(p, n_trials, seed=None):
+    return np.random.default_rng(seed).binomial(1, p, n_trials)
+
+
+# Poisson Process: samples, mean and P(X = k) for counts with rate lambda (scipy)
+def poisson_summary(lam, n_samples, k, seed=None):
+    from scipy import stats
+
+    rv = stats.poisson(lam)
+    return {"samples": rv.rvs(n_samples, random_state=np.random.default_rng(seed)), "mean": rv.mean(), "pmf": rv.pmf(k)}